@@ -1,15 +1,20 @@
 import logging
 import re
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 
-import requests
+import httpx
 from fastapi import FastAPI
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 from shared.auth import InMemoryPendingAuthStore, SixDigitAuthCodeGenerator
 from shared.auth_service import AuthMicroservice, AuthCommandContext, AssistantAuthContext
 from shared.logging_utils import configure_logging
+from shared.gateway_http import gateway_session
 from shared.runtime_config import assistant_mode_enabled, whatsapp_gateway_url
 from shared.auth_runtime_config import runtime_config
 from shared.whatsapp_formatting import format_admin_auth_request
@@ -17,11 +22,33 @@ from shared.whatsapp_formatting import format_admin_auth_request
 log_level = configure_logging()
 logger = logging.getLogger(__name__)
 
+_SIX_DIGIT_CODE = re.compile(r"\d{6}")
+_INSTRUCTION_COMMANDS = frozenset({"instructions", "help", "commands", "hi"})
+
+# Set while an event is handled for the async endpoint: replies are queued here
+# and sent asynchronously afterwards instead of blocking on the gateway.
+_reply_outbox: ContextVar[Optional[list[tuple[str, str, Optional[str]]]]] = ContextVar(
+    "auth_reply_outbox",
+    default=None,
+)
+
 
 class WhatsAppTransport:
     def __init__(self, base_url: str | None = None, timeout_seconds: int = 5):
         self.base_url = base_url or whatsapp_gateway_url()
         self.timeout = timeout_seconds
+        self.session = gateway_session()
+        self.async_client: httpx.AsyncClient | None = None
+
+    def open_async_client(self) -> httpx.AsyncClient:
+        if self.async_client is None:
+            self.async_client = httpx.AsyncClient(timeout=self.timeout)
+        return self.async_client
+
+    async def aclose(self) -> None:
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
 
     def send_message(
         self,
@@ -34,7 +61,24 @@ class WhatsAppTransport:
         if quoted_message_id:
             payload["quoted_message_id"] = quoted_message_id
 
-        resp = requests.post(f"{self.base_url}/send", json=payload, timeout=self.timeout)
+        resp = self.session.post(f"{self.base_url}/send", json=payload, timeout=self.timeout)
+        if resp.status_code != 200:
+            raise RuntimeError(f"Gateway error {resp.status_code}: {resp.text}")
+        data = resp.json()
+        return str(data.get("message_id")) if data.get("message_id") else None
+
+    async def send_message_async(
+        self,
+        *,
+        chat_id: str,
+        text: str,
+        quoted_message_id: str | None = None,
+    ) -> str | None:
+        payload: Dict[str, str] = {"to": chat_id, "text": text}
+        if quoted_message_id:
+            payload["quoted_message_id"] = quoted_message_id
+
+        resp = await self.open_async_client().post(f"{self.base_url}/send", json=payload)
         if resp.status_code != 200:
             raise RuntimeError(f"Gateway error {resp.status_code}: {resp.text}")
         data = resp.json()
@@ -85,53 +129,40 @@ class AuthEventService:
             extract_requester_identity=self._extract_requester_identity,
             format_admin_auth_request=format_admin_auth_request,
         )
+        self._command_handlers: Dict[str, Callable[[WhatsAppInboundEvent, AuthCommandContext], tuple[bool, Optional[str]]]] = {
+            "!whoami": self._handle_whoami,
+            "!auth": self._handle_assistant_auth,
+        }
 
     def handle_inbound_event(self, event: WhatsAppInboundEvent) -> tuple[bool, Optional[str]]:
         text = (event.text or "").strip()
-        normalized = text.lower()
-        unauthorized_assistant_sender = (
-            assistant_mode_enabled()
-            and not runtime_config.is_sender_approved(event.sender_id)
+        parts = text.split(None, 1)
+        command = parts[0].lower() if parts else ""
+        normalized_sender_id = runtime_config.normalize_sender_id(event.sender_id)
+        context = AuthCommandContext(
+            chat_id=event.chat_id,
+            sender_id=event.sender_id,
+            normalized_sender_id=normalized_sender_id,
+            message_id=event.message_id,
+            text=text,
+            command=command,
+            argument=parts[1].strip() if len(parts) > 1 else "",
         )
 
-        if normalized.startswith("!whoami"):
-            return self.auth_service.handle_whoami(
-                context=AuthCommandContext(
-                    chat_id=event.chat_id,
-                    sender_id=event.sender_id,
-                    message_id=event.message_id,
-                    text=text,
-                )
-            )
+        handler = self._command_handlers.get(command)
+        if handler is not None:
+            return handler(event, context)
 
-        is_six_digit_code = bool(re.fullmatch(r"\d{6}", text))
-        has_pending_auth = bool(self._get_pending_auth(event.sender_id, datetime.now(timezone.utc)))
-
-        if normalized.startswith("!auth") or (is_six_digit_code and has_pending_auth):
-            return self.auth_service.handle_assistant_auth(
-                context=AssistantAuthContext(
-                    chat_id=event.chat_id,
-                    sender_id=event.sender_id,
-                    message_id=event.message_id,
-                    text=text,
-                    is_group=event.is_group,
-                    contact_name=event.contact_name,
-                    contact_phone=event.contact_phone,
-                    raw=event.raw,
-                )
-            )
+        if (
+            _SIX_DIGIT_CODE.fullmatch(text)
+            and self._get_pending_auth(normalized_sender_id, datetime.now(timezone.utc))
+        ):
+            return self._handle_assistant_auth(event, context)
 
-        if normalized in {"instructions", "help", "commands", "hi"}:
-            return self.auth_service.handle_instructions_command(
-                context=AuthCommandContext(
-                    chat_id=event.chat_id,
-                    sender_id=event.sender_id,
-                    message_id=event.message_id,
-                    text=text,
-                )
-            )
+        if len(parts) == 1 and command in _INSTRUCTION_COMMANDS:
+            return self.auth_service.handle_instructions_command(context=context)
 
-        if unauthorized_assistant_sender:
+        if assistant_mode_enabled() and not runtime_config.is_sender_approved(event.sender_id):
             hint = (
                 "🔐 You're not authorized yet. Please send me a private message with !auth to get started."
                 if event.is_group
@@ -142,30 +173,91 @@ class AuthEventService:
 
         return False, "auth_command_only"
 
+    def _handle_whoami(
+        self,
+        event: WhatsAppInboundEvent,
+        context: AuthCommandContext,
+    ) -> tuple[bool, Optional[str]]:
+        return self.auth_service.handle_whoami(context=context)
+
+    def _handle_assistant_auth(
+        self,
+        event: WhatsAppInboundEvent,
+        context: AuthCommandContext,
+    ) -> tuple[bool, Optional[str]]:
+        return self.auth_service.handle_assistant_auth(
+            context=AssistantAuthContext(
+                chat_id=context.chat_id,
+                sender_id=context.sender_id,
+                normalized_sender_id=context.normalized_sender_id,
+                message_id=context.message_id,
+                text=context.text,
+                command=context.command,
+                argument=context.argument,
+                is_group=event.is_group,
+                contact_name=event.contact_name,
+                contact_phone=event.contact_phone,
+                raw=event.raw,
+            )
+        )
+
+    async def handle_inbound_event_async(self, event: WhatsAppInboundEvent) -> tuple[bool, Optional[str]]:
+        outbox: list[tuple[str, str, Optional[str]]] = []
+        token = _reply_outbox.set(outbox)
+        try:
+            # Config reads and writes touch the filesystem; keep them off the loop.
+            # The worker thread runs in a copy of this context, so it fills outbox.
+            result = await run_in_threadpool(self.handle_inbound_event, event)
+        finally:
+            _reply_outbox.reset(token)
+
+        # Replies go out in order, without holding a threadpool slot on the gateway.
+        for chat_id, text, quoted_message_id in outbox:
+            await self._send_reply_async(chat_id, text, quoted_message_id)
+        return result
+
     def _send_reply(self, chat_id: str, text: str, quoted_message_id: Optional[str]) -> Optional[str]:
+        outbox = _reply_outbox.get()
+        if outbox is not None:
+            outbox.append((chat_id, text, quoted_message_id))
+            return None
         try:
             return self.transport.send_message(chat_id=chat_id, text=text, quoted_message_id=quoted_message_id)
         except Exception:
             logger.exception("Failed sending auth reply")
             return None
 
-    def _get_pending_auth(self, sender_id: str, now: datetime) -> Optional[dict[str, object]]:
-        key = runtime_config.normalize_sender_id(sender_id)
-        entry = self.pending_auth_store.get(key, now)
+    async def _send_reply_async(
+        self,
+        chat_id: str,
+        text: str,
+        quoted_message_id: Optional[str],
+    ) -> Optional[str]:
+        try:
+            return await self.transport.send_message_async(
+                chat_id=chat_id,
+                text=text,
+                quoted_message_id=quoted_message_id,
+            )
+        except Exception:
+            logger.exception("Failed sending auth reply")
+            return None
+
+    def _get_pending_auth(self, normalized_sender_id: str, now: datetime) -> Optional[dict[str, object]]:
+        entry = self.pending_auth_store.get(normalized_sender_id, now)
         return {"code": entry.code, "updated_at": entry.updated_at} if entry else None
 
-    def _set_pending_auth(self, sender_id: str, code: str, now: datetime) -> None:
-        key = runtime_config.normalize_sender_id(sender_id)
-        self.pending_auth_store.set(key, code, now)
+    def _set_pending_auth(self, normalized_sender_id: str, code: str, now: datetime) -> None:
+        self.pending_auth_store.set(normalized_sender_id, code, now)
 
-    def _clear_pending_auth(self, sender_id: str) -> None:
-        key = runtime_config.normalize_sender_id(sender_id)
-        self.pending_auth_store.clear(key)
+    def _clear_pending_auth(self, normalized_sender_id: str) -> None:
+        self.pending_auth_store.clear(normalized_sender_id)
 
     def _extract_requester_identity(
         self,
         *,
         sender_id: str,
+        normalized_sender_id: str,
         contact_name: Optional[str],
         contact_phone: Optional[str | list[str]],
         raw: Optional[dict],
@@ -197,17 +289,16 @@ class AuthEventService:
                 phone_display = wa_id
 
         if not phone_display:
-            normalized_sender = runtime_config.normalize_sender_id(sender_id)
-            phone_display = normalized_sender or "-"
+            phone_display = normalized_sender_id or "-"
 
         return display_name, phone_display
 
 
-app = FastAPI()
-auth_event_service = AuthEventService()
+@lru_cache(maxsize=1)
+def get_auth_event_service() -> AuthEventService:
+    return AuthEventService()
 
 
-@app.on_event("startup")
 def log_admin_setup() -> None:
     logger.info("Auth commands: !auth / !whoami")
     if runtime_config.admin_sender_id():
@@ -220,9 +311,23 @@ def log_admin_setup() -> None:
     logger.warning("============================")
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    log_admin_setup()
+    transport = get_auth_event_service().transport
+    transport.open_async_client()
+    try:
+        yield
+    finally:
+        await transport.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
 @app.post("/whatsapp/events", response_model=WhatsAppEventResponse)
-def whatsapp_events(event: WhatsAppInboundEvent):
-    accepted, reason = auth_event_service.handle_inbound_event(event)
+async def whatsapp_events(event: WhatsAppInboundEvent):
+    accepted, reason = await get_auth_event_service().handle_inbound_event_async(event)
     return WhatsAppEventResponse(accepted=accepted, reason=reason)
 
 
@@ -0,0 +1,18 @@
+import pytest
+
+from auth_service.app import get_auth_event_service
+from shared.runtime_config import reset_config_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_auth_event_service():
+    get_auth_event_service.cache_clear()
+    yield
+    get_auth_event_service.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_cache():
+    reset_config_cache()
+    yield
+    reset_config_cache()
@@ -1,6 +1,9 @@
+import asyncio
 from datetime import datetime, timezone
 
-from auth_service.app import AuthEventService, WhatsAppInboundEvent
+from fastapi.testclient import TestClient
+
+from auth_service.app import AuthEventService, WhatsAppInboundEvent, app, get_auth_event_service
 from shared.auth_runtime_config import runtime_config
 
 
@@ -137,3 +140,57 @@ def test_plain_code_without_pending_auth_is_ignored(monkeypatch):
 
     assert handled is False
     assert reason == "auth_command_only"
+
+
+def test_async_handler_sends_queued_replies_in_order(monkeypatch):
+    monkeypatch.setenv("WHATSAPP_ASSISTANT_MODE", "false")
+    sent = []
+
+    monkeypatch.setattr(runtime_config, "admin_sender_id", lambda: "")
+    monkeypatch.setattr(runtime_config, "admin_setup_code", lambda: "123456")
+    monkeypatch.setattr(runtime_config, "set_admin_sender_id", lambda value: None)
+
+    service = AuthEventService()
+
+    def fail_sync_send(**kwargs):
+        raise AssertionError("sync transport used from the async handler")
+
+    async def send_message_async(*, chat_id, text, quoted_message_id=None):
+        sent.append((chat_id, text, quoted_message_id))
+        return None
+
+    monkeypatch.setattr(service.transport, "send_message", fail_sync_send)
+    monkeypatch.setattr(service.transport, "send_message_async", send_message_async)
+
+    handled, reason = asyncio.run(service.handle_inbound_event_async(_event(text="!whoami 123456")))
+
+    assert handled is True and reason is None
+    assert sent == [("dm-1", "✅ Admin set to 15551234567@s.whatsapp.net.", "m1")]
+
+
+def test_events_endpoint_reuses_lazy_service(monkeypatch):
+    monkeypatch.setenv("WHATSAPP_ASSISTANT_MODE", "false")
+
+    client = TestClient(app)
+    response = client.post("/whatsapp/events", json=_event(text="add").model_dump())
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "accepted": False, "reason": "auth_command_only"}
+    assert get_auth_event_service() is get_auth_event_service()
+
+
+def test_whoami_accepts_any_whitespace_before_code(monkeypatch):
+    state = {"admin_sender_id": ""}
+
+    monkeypatch.setattr(runtime_config, "admin_sender_id", lambda: state["admin_sender_id"])
+    monkeypatch.setattr(runtime_config, "admin_setup_code", lambda: "123456")
+    monkeypatch.setattr(runtime_config, "set_admin_sender_id", lambda value: state.update({"admin_sender_id": value}))
+
+    service = AuthEventService()
+    monkeypatch.setattr(service, "_send_reply", lambda chat_id, text, quoted: None)
+    service.auth_service._send_reply = service._send_reply
+
+    handled, reason = service.handle_inbound_event(_event(text="!WhoAmI\t 123456 "))
+
+    assert handled is True and reason is None
+    assert state["admin_sender_id"] == "15551234567@s.whatsapp.net"
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import heapq
 import secrets
+import threading
 from typing import Protocol
 
 
+def generate_six_digit_code() -> str:
+    return f"{secrets.randbelow(1_000_000):06d}"
+
+
 class AuthCodeGenerator(Protocol):
     def generate(self) -> str:
         ...
@@ -13,7 +19,7 @@ class AuthCodeGenerator(Protocol):
 
 class SixDigitAuthCodeGenerator:
     def generate(self) -> str:
-        return f"{secrets.randbelow(1_000_000):06d}"
+        return generate_six_digit_code()
 
 
 @dataclass(frozen=True)
@@ -37,18 +43,37 @@ class InMemoryPendingAuthStore:
     def __init__(self, ttl: timedelta) -> None:
         self._ttl = ttl
         self._entries: dict[str, PendingAuthEntry] = {}
+        # (expires_at, key) min-heap; overwritten entries are skipped lazily on pop.
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        # Guards every access: reads evict expired entries as they go.
+        self._lock = threading.Lock()
 
     def get(self, key: str, now: datetime) -> PendingAuthEntry | None:
-        entry = self._entries.get(key)
-        if not entry:
-            return None
-        if now - entry.updated_at > self._ttl:
-            self._entries.pop(key, None)
-            return None
-        return entry
+        with self._lock:
+            self._evict_expired(now)
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            if now - entry.updated_at > self._ttl:
+                del self._entries[key]
+                return None
+            return entry
 
     def set(self, key: str, code: str, now: datetime) -> None:
-        self._entries[key] = PendingAuthEntry(code=code, updated_at=now)
+        with self._lock:
+            self._evict_expired(now)
+            self._entries[key] = PendingAuthEntry(code=code, updated_at=now)
+            heapq.heappush(self._expiry_heap, (now + self._ttl, key))
 
     def clear(self, key: str) -> None:
-        self._entries.pop(key, None)
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _evict_expired(self, now: datetime) -> None:
+        # Caller must hold self._lock.
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry.updated_at + self._ttl == expires_at:
+                del self._entries[key]
@@ -1,13 +1,16 @@
 import os
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Mapping
 
-from shared.runtime_config import CommonRuntimeConfig, JsonFileConfig
+from shared.auth import generate_six_digit_code
+from shared.runtime_config import CommonRuntimeConfig, JsonFileConfig, common_runtime_config
 
 
 DEFAULT_AUTH_CONFIG_PATH = os.getenv(
     "WHATSAPP_AUTH_CONFIG_PATH",
     "config/auth_runtime.json",
 )
+SETUP_CODE_CACHE_SECONDS = 5.0
 
 
 class AuthRuntimeConfig(JsonFileConfig):
@@ -16,32 +19,40 @@ class AuthRuntimeConfig(JsonFileConfig):
         path: str = DEFAULT_AUTH_CONFIG_PATH,
         common: CommonRuntimeConfig | None = None,
     ) -> None:
-        self._common = common or CommonRuntimeConfig()
+        self._common = common or common_runtime_config()
+        # (monotonic timestamp, code); spares a stat per message while no admin is set.
+        self._setup_code_cache: tuple[float, str] | None = None
         super().__init__(path, debug_label="auth_config")
 
     def admin_sender_id(self) -> str:
         return self._common.admin_sender_id()
 
     def admin_setup_code(self) -> str:
+        cached = self._setup_code_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < SETUP_CODE_CACHE_SECONDS:
+            return cached[1]
+
         self._refresh_if_changed()
         code = str(self._data.get("admin_setup_code") or "")
-        if code:
-            return code
-        code = self._generate_setup_code()
-        with self._lock:
-            data = self._load_from_disk()
-            data["admin_setup_code"] = code
-            self._write_to_disk(data)
-        self._data = data
+        if not code:
+            code = self._generate_setup_code()
+            with self._lock:
+                data = self._load_for_update()
+                data["admin_setup_code"] = code
+                self._write_to_disk(data)
+                self._set_data(data)
+        self._setup_code_cache = (now, code)
         return code
 
     def set_admin_sender_id(self, sender_id: str) -> None:
         self._common.set_admin_sender_id(sender_id)
+        self._setup_code_cache = None
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             data["admin_setup_code"] = ""
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def normalize_sender_id(self, sender_id: str) -> str:
         return self._common.normalize_sender_id(sender_id)
@@ -52,11 +63,11 @@ class AuthRuntimeConfig(JsonFileConfig):
     def add_approved_number(self, number: str) -> None:
         self._common.add_approved_number(number)
 
-    def instructions(self) -> dict[str, str]:
+    def instructions(self) -> Mapping[str, str]:
         return self._common.instructions()
 
     def _generate_setup_code(self) -> str:
-        return f"{int.from_bytes(os.urandom(3), 'big') % 1_000_000:06d}"
+        return generate_six_digit_code()
 
     def _default_data(self) -> Dict[str, Any]:
         return {"admin_setup_code": ""}
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Callable, Iterable, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +29,12 @@ def authorize_admin_command(
 class AuthCommandContext:
     chat_id: str
     sender_id: str
+    normalized_sender_id: str
     message_id: str
     text: str
+    # First whitespace-separated token, lowercased, and the stripped remainder.
+    command: str
+    argument: str
 
 
 @dataclass(frozen=True)
@@ -56,7 +60,7 @@ class AuthMicroservice:
         get_pending_auth: Callable[[str, datetime], Optional[dict[str, object]]],
         set_pending_auth: Callable[[str, str, datetime], None],
         clear_pending_auth: Callable[[str], None],
-        instructions: Callable[[], dict[str, str]],
+        instructions: Callable[[], Mapping[str, str]],
         now: Callable[[], datetime],
         extract_requester_identity: Callable[..., tuple[str, str]],
         format_admin_auth_request: Callable[..., str],
@@ -76,6 +80,9 @@ class AuthMicroservice:
         self._now = now
         self._extract_requester_identity = extract_requester_identity
         self._format_admin_auth_request = format_admin_auth_request
+        # include_welcome -> (instructions mapping, formatted message). The config
+        # swaps in a new mapping on every reload, so identity is a cheap change check.
+        self._instructions_message_cache: dict[bool, tuple[Mapping[str, str], str]] = {}
 
     def handle_whoami(self, *, context: AuthCommandContext) -> tuple[bool, Optional[str]]:
         admin_id = self._admin_sender_id()
@@ -83,9 +90,7 @@ class AuthMicroservice:
             self._send_reply(context.chat_id, "✅ Admin already set.", context.message_id)
             return True, None
 
-        parts = context.text.strip().split(None, 1)
-        code = parts[1].strip() if len(parts) > 1 else ""
-        if code != self._admin_setup_code():
+        if context.argument != self._admin_setup_code():
             self._send_reply(context.chat_id, "❌ Invalid setup code.", context.message_id)
             return False, "invalid_setup_code"
 
@@ -98,16 +103,15 @@ class AuthMicroservice:
             self._send_reply(context.chat_id, "❌ Please DM me to authenticate.", context.message_id)
             return False, "auth_in_group"
 
-        normalized = self._normalize_sender_id(context.sender_id)
+        normalized = context.normalized_sender_id
         if self._is_sender_approved(context.sender_id):
             self._send_reply(context.chat_id, "✅ Already approved.", context.message_id)
             return True, None
 
-        text = context.text.strip()
-        parts = text.split(None, 1)
-        if text.lower().startswith("!auth") and len(parts) == 1:
+        is_auth_command = context.command == "!auth"
+        if is_auth_command and not context.argument:
             code = self._generate_auth_code()
-            self._set_pending_auth(context.sender_id, code, self._now())
+            self._set_pending_auth(normalized, code, self._now())
             logger.warning("Assistant auth code for %s: %s", normalized, code)
             self._notify_admin_auth_request(
                 requester_sender_id=context.sender_id,
@@ -125,18 +129,18 @@ class AuthMicroservice:
             )
             return True, None
 
-        pending = self._get_pending_auth(context.sender_id, self._now())
+        pending = self._get_pending_auth(normalized, self._now())
         if not pending:
             self._send_reply(context.chat_id, "❌ No pending auth request. Send !auth to generate a new code.", context.message_id)
             return False, "auth_not_requested"
 
-        code = parts[1].strip() if text.lower().startswith("!auth") and len(parts) > 1 else text
+        code = context.argument if is_auth_command else context.text
         if code != pending.get("code"):
             self._send_reply(context.chat_id, "❌ Invalid auth code. Send !auth to generate a new code.", context.message_id)
             return False, "invalid_auth_code"
 
         self._add_approved_number(normalized)
-        self._clear_pending_auth(context.sender_id)
+        self._clear_pending_auth(normalized)
         self._send_reply(context.chat_id, f"✅ Approved: {normalized}.", context.message_id)
         self._send_reply(context.chat_id, self.build_instructions_message(include_welcome=True), context.message_id)
         return True, None
@@ -184,6 +188,7 @@ class AuthMicroservice:
 
         name_display, phone_display = self._extract_requester_identity(
             sender_id=requester_sender_id,
+            normalized_sender_id=requester_normalized_id,
             contact_name=requester_contact_name,
             contact_phone=requester_contact_phone,
             raw=raw,
@@ -200,9 +205,20 @@ class AuthMicroservice:
         self._send_reply(admin_id, admin_message, None)
 
     def build_instructions_message(self, *, include_welcome: bool) -> str:
+        instructions = self._instructions()
+        cached = self._instructions_message_cache.get(include_welcome)
+        if cached is not None and cached[0] is instructions:
+            return cached[1]
+
+        message = self._format_instructions_message(instructions.values(), include_welcome=include_welcome)
+        self._instructions_message_cache[include_welcome] = (instructions, message)
+        return message
+
+    @staticmethod
+    def _format_instructions_message(instructions: Iterable[str], *, include_welcome: bool) -> str:
         lines = [
             str(instruction).strip()
-            for instruction in self._instructions().values()
+            for instruction in instructions
             if str(instruction).strip()
         ]
         if not lines:
@@ -0,0 +1,24 @@
+from functools import cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@cache
+def gateway_session() -> requests.Session:
+    """
+    Process-wide pooled session for calls to the WhatsApp gateway.
+
+    Keep-alive connections are reused across sends. Only connection failures
+    are retried: a read error or 5xx may mean the message already went out.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -1,24 +1,61 @@
-import json
+import hashlib
 import logging
+import mmap
 import os
 import re
+import time
+from functools import cache, lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict
+from types import MappingProxyType
+from threading import RLock
+from typing import Any, Dict, Mapping
+
+from shared import json_codec
 
 
 DEFAULT_COMMON_CONFIG_PATH = os.getenv("WHATSAPP_COMMON_CONFIG_PATH", "config/common_runtime.json")
+# Minimum seconds between mtime checks; bursts of accessor calls share one stat().
+CHECK_INTERVAL = float(os.getenv("WHATSAPP_CONFIG_CHECK_INTERVAL", "1.0"))
+_CONFIG_DEBUG = os.getenv("WHATSAPP_CONFIG_DEBUG", "").lower() == "true"
 logger = logging.getLogger(__name__)
 
+# Sender ids are ASCII; bytes.translate drops everything but 0-9 in one C table pass.
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+_NON_ASCII_DIGITS = re.compile(r"[^0-9]+")
+
+
+# Read-only private mapping: the parser reads straight from the page cache.
+if os.name == "posix":
+    _MMAP_READ_KWARGS = {"flags": mmap.MAP_PRIVATE, "prot": mmap.PROT_READ}
+else:
+    _MMAP_READ_KWARGS = {"access": mmap.ACCESS_READ}
+
+
+def strip_non_digits(value: str) -> str:
+    if value.isascii():
+        return value.encode("ascii").translate(None, _NON_DIGIT_BYTES).decode("ascii")
+    return _NON_ASCII_DIGITS.sub("", value)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_sender_id(sender_id: str) -> str:
+    if sender_id.isascii() and sender_id.isdigit():
+        return sender_id
+    digits = strip_non_digits(sender_id)
+    return digits if digits else sender_id.strip()
+
 
 class JsonFileConfig:
     def __init__(self, path: str, *, debug_label: str) -> None:
         self._debug_label = debug_label
         self._path = Path(path)
-        self._lock = Lock()
-        self._data = self._load_from_disk()
-        self._last_mtime = self._get_mtime()
-        if os.getenv("WHATSAPP_CONFIG_DEBUG", "").lower() == "true":
+        # Reentrant: mutators hold it across _load_for_update's reload check.
+        self._lock = RLock()
+        self._last_hash: bytes | None = None
+        self._set_data(self._load_from_disk())
+        self._last_stamp = self._get_stamp()
+        self._last_check_monotonic = time.monotonic()
+        if _CONFIG_DEBUG:
             message = self._debug_message()
             if message:
                 logger.info("[%s] path=%s %s", self._debug_label, self._path, message)
@@ -28,36 +65,98 @@ class JsonFileConfig:
     def _debug_message(self) -> str:
         return ""
 
-    def _load_from_disk(self) -> Dict[str, Any]:
+    def _set_data(self, data: Dict[str, Any]) -> None:
+        self._data = data
+        self._on_data_changed()
+
+    def _on_data_changed(self) -> None:
+        """Hook for subclasses to rebuild values derived from self._data."""
+
+    def _load_from_disk(self, *, skip_unchanged: bool = False) -> Dict[str, Any] | None:
+        """
+        Parse the config file, or return defaults when it is missing or invalid.
+
+        With skip_unchanged, returns None instead of parsing when the file bytes
+        hash the same as the last content read or written.
+        """
         if not self._path.exists():
             return self._default_data()
         try:
-            return json.loads(self._path.read_text(encoding="utf-8"))
+            with open(self._path, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    raise ValueError("empty config file")
+                with mmap.mmap(fh.fileno(), 0, **_MMAP_READ_KWARGS) as mapped:
+                    if hasattr(mmap, "MADV_WILLNEED"):
+                        mapped.madvise(mmap.MADV_WILLNEED)
+                    digest = hashlib.blake2b(mapped, digest_size=16).digest()
+                    if skip_unchanged and digest == self._last_hash:
+                        return None
+                    with memoryview(mapped) as view:
+                        data = json_codec.loads(view)
+                    self._last_hash = digest
+                    return data
         except Exception as exc:
             logger.warning("[%s] failed to parse %s: %s", self._debug_label, self._path, exc)
             return self._default_data()
 
+    def _load_for_update(self) -> Dict[str, Any]:
+        """Private copy of the current data to base a read-modify-write on; caller holds self._lock."""
+        # Another service or an operator may have edited the file since our last
+        # throttled check, so stat it unconditionally. When the stamp matches,
+        # self._data already holds every change we wrote and is forked as is.
+        self._reload_if_stamp_changed()
+        return json_codec.loads(json_codec.dumps(self._data))
+
     def _write_to_disk(self, data: Dict[str, Any]) -> None:
+        """
+        Atomically replace the config file with data.
+
+        Callers hold self._lock and only update self._data after this returns,
+        so a failed write raises instead of leaving memory ahead of disk.
+        """
+        payload = json_codec.dumps_pretty(data)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._last_hash and self._get_stamp() == self._last_stamp:
+            # Same bytes as our last write and nobody touched the file since.
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        self._last_mtime = self._get_mtime()
+        tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self._path)
+        self._last_hash = digest
+        self._last_stamp = self._get_stamp()
 
     def _default_data(self) -> Dict[str, Any]:
         return {}
 
-    def _get_mtime(self) -> float | None:
+    def _get_stamp(self) -> tuple[int, int] | None:
+        # Nanosecond mtime plus size: catches same-second edits that st_mtime misses.
         try:
-            return self._path.stat().st_mtime
+            stat = self._path.stat()
         except FileNotFoundError:
             return None
+        return stat.st_mtime_ns, stat.st_size
 
     def _refresh_if_changed(self) -> None:
-        current = self._get_mtime()
-        if current is None or current == self._last_mtime:
+        now = time.monotonic()
+        if now - self._last_check_monotonic < CHECK_INTERVAL:
             return
-        self._data = self._load_from_disk()
-        self._last_mtime = current
-        if os.getenv("WHATSAPP_CONFIG_DEBUG", "").lower() == "true":
+        self._last_check_monotonic = now
+        with self._lock:
+            self._reload_if_stamp_changed()
+
+    def _reload_if_stamp_changed(self) -> None:
+        """Reload from disk if the file changed since we last read or wrote it; caller holds self._lock."""
+        current = self._get_stamp()
+        if current is None or current == self._last_stamp:
+            return
+        data = self._load_from_disk(skip_unchanged=True)
+        self._last_stamp = current
+        if data is None:
+            # Touched or rewritten with identical bytes; nothing to reparse.
+            return
+        self._set_data(data)
+        if _CONFIG_DEBUG:
             message = self._debug_message()
             if message:
                 logger.info("[%s] reloaded %s", self._debug_label, message)
@@ -74,13 +173,20 @@ class CommonRuntimeConfig(JsonFileConfig):
         count = len(instructions) if isinstance(instructions, dict) else 0
         return f"admin={self._data.get('admin_sender_id')!r} instructions={count}"
 
+    def _on_data_changed(self) -> None:
+        # Membership checks run per inbound event; rebuild only on reload or write.
+        self._approved_list = self._collect_approved_numbers()
+        self._approved_set = frozenset(self._approved_list)
+        self._admin_sender_id = str(self._data.get("admin_sender_id") or "")
+        self._instructions = MappingProxyType(self._collect_instructions())
+
     def admin_sender_id(self) -> str:
         self._refresh_if_changed()
-        return str(self._data.get("admin_sender_id") or "")
+        return self._admin_sender_id
 
     def set_admin_sender_id(self, sender_id: str) -> None:
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             data["admin_sender_id"] = sender_id
             normalized_admin = self.normalize_sender_id(sender_id)
             approved = list(data.get("approved_numbers") or [])
@@ -88,19 +194,28 @@ class CommonRuntimeConfig(JsonFileConfig):
                 approved.append(normalized_admin)
             data["approved_numbers"] = approved
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
+
+    def approved_set(self) -> frozenset[str]:
+        self._refresh_if_changed()
+        return self._approved_set
 
     def approved_numbers(self) -> list[str]:
         self._refresh_if_changed()
+        return list(self._approved_list)
+
+    def _collect_approved_numbers(self) -> list[str]:
+        seen: set[str] = set()
         approved: list[str] = []
-        for value in list(self._data.get("approved_numbers") or []):
+        for value in self._data.get("approved_numbers") or ():
             normalized = self.normalize_sender_id(str(value))
-            if normalized and normalized not in approved:
+            if normalized and normalized not in seen:
+                seen.add(normalized)
                 approved.append(normalized)
         admin_normalized = self.normalize_sender_id(
             str(self._data.get("admin_sender_id") or "")
         )
-        if admin_normalized and admin_normalized not in approved:
+        if admin_normalized and admin_normalized not in seen:
             approved.append(admin_normalized)
         return approved
 
@@ -109,16 +224,19 @@ class CommonRuntimeConfig(JsonFileConfig):
         if not normalized:
             return
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             approved = list(data.get("approved_numbers") or [])
             if normalized not in approved:
                 approved.append(normalized)
             data["approved_numbers"] = approved
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
-    def instructions(self) -> Dict[str, str]:
+    def instructions(self) -> Mapping[str, str]:
         self._refresh_if_changed()
+        return self._instructions
+
+    def _collect_instructions(self) -> Dict[str, str]:
         raw = self._data.get("instructions")
         if not isinstance(raw, dict):
             return {}
@@ -134,42 +252,42 @@ class CommonRuntimeConfig(JsonFileConfig):
         if not service_name:
             return
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             instructions = dict(data.get("instructions") or {})
             if instruction:
                 if instructions.get(service_name) == instruction:
-                    self._data = data
+                    self._set_data(data)
                     return
                 instructions[service_name] = instruction
             else:
                 instructions.pop(service_name, None)
             data["instructions"] = instructions
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def remove_approved_number(self, number: str) -> None:
         normalized = self.normalize_sender_id(number)
         if not normalized:
             return
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             approved = list(data.get("approved_numbers") or [])
             data["approved_numbers"] = [
                 n for n in approved
                 if self.normalize_sender_id(str(n)) != normalized
             ]
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def normalize_sender_id(self, sender_id: str) -> str:
-        digits = re.sub(r"\D", "", sender_id or "")
-        return digits if digits else (sender_id or "").strip()
+        return _normalize_sender_id(sender_id or "")
 
     def is_sender_approved(self, sender_id: str) -> bool:
         normalized = self.normalize_sender_id(sender_id)
         if not normalized:
             return False
-        return normalized in set(self.approved_numbers())
+        self._refresh_if_changed()
+        return normalized in self._approved_set
 
     def _default_data(self) -> Dict[str, Any]:
         return {
@@ -179,21 +297,26 @@ class CommonRuntimeConfig(JsonFileConfig):
         }
 
 
-common_runtime_config = CommonRuntimeConfig()
+@cache
+def common_runtime_config() -> CommonRuntimeConfig:
+    """Shared common config, loaded on first use rather than at import."""
+    return CommonRuntimeConfig()
 
 
+@cache
 def assistant_mode_enabled() -> bool:
     return os.getenv("WHATSAPP_ASSISTANT_MODE", "").lower() == "true"
 
 
 def normalize_sender_id(value: str) -> str:
-    return common_runtime_config.normalize_sender_id(value)
+    return _normalize_sender_id(value or "")
 
 
 def is_sender_approved(value: str) -> bool:
-    return common_runtime_config.is_sender_approved(value)
+    return common_runtime_config().is_sender_approved(value)
 
 
+@cache
 def whatsapp_gateway_url() -> str:
     override = os.getenv("WHATSAPP_GATEWAY_URL")
     if override:
@@ -203,3 +326,9 @@ def whatsapp_gateway_url() -> str:
             "WHATSAPP_OFFICIAL_GATEWAY_URL", "http://official_gateway:3000"
         )
     return os.getenv("WHATSAPP_BAILEYS_GATEWAY_URL", "http://whatsapp_gateway:3000")
+
+
+def reset_config_cache() -> None:
+    """Forget settings cached from the environment; for tests that change it."""
+    assistant_mode_enabled.cache_clear()
+    whatsapp_gateway_url.cache_clear()
@@ -1,12 +1,18 @@
+import atexit
 import logging
 import os
-from flask import Flask, request, jsonify
+from typing import Any
+
+from flask import Flask, Request, Response, request
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
 
 from extractors.trafilatura_extractor import TrafilaturaArticleTextExtractor
-from summarizers.gpt_summarizer import GPTSummarizer
+from summarizers.gpt_summarizer import get_summarizer
 from communicators.news_url_communicator import UrlCommunicator
+from web_page_fetchers.playwright_web_page_fetcher import PlaywrightFetcher
 from runtime_config import runtime_config
+from shared import json_codec
 from shared.logging_utils import configure_logging
 
 load_dotenv()
@@ -15,7 +21,36 @@ log_level = configure_logging()
 logging.getLogger("werkzeug").setLevel(log_level)
 logger = logging.getLogger(__name__)
 
+
+class JsonCodecRequest(Request):
+    """Parses JSON bodies with the shared codec and does not keep the raw body around."""
+
+    def get_json(self, force: bool = False, silent: bool = False, cache: bool = False) -> Any:
+        if not (force or self.is_json):
+            if silent:
+                return None
+            return self.on_json_loading_failed(None)
+        try:
+            return json_codec.loads(self.get_data(cache=cache))
+        except ValueError as exc:
+            if silent:
+                return None
+            return self.on_json_loading_failed(exc)
+
+
+class JsonCodecProvider(JSONProvider):
+    """app.json backed by the shared codec; keys keep insertion order, no sorting."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return json_codec.dumps(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return json_codec.loads(s)
+
+
 app = Flask(__name__)
+app.request_class = JsonCodecRequest
+app.json = JsonCodecProvider(app)
 logger.info("Summarizer commands: !setup summarizer / !stop summarizer")
 
 SUMMARIZER_INSTRUCTION = (
@@ -28,21 +63,30 @@ for _, instruction in runtime_config.instructions().items():
 
 # Initialize services
 extractor = TrafilaturaArticleTextExtractor()
-summarizer = GPTSummarizer()
+summarizer = get_summarizer()
+atexit.register(summarizer.close)
 communicator = UrlCommunicator(extractor, summarizer)
 
+if os.getenv("PLAYWRIGHT_WARM_START", "false").lower() == "true":
+    PlaywrightFetcher.warm_start()
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    return app.response_class(json_codec.dumps(data), status=status, mimetype="application/json")
+
+
 @app.route("/whatsapp/events", methods=["POST"])
 def whatsapp_events():
     payload = request.get_json(silent=True)
     if not payload:
-        return jsonify({"status": "error", "message": "Invalid JSON payload"}), 400
+        return json_response({"status": "error", "message": "Invalid JSON payload"}, 400)
 
     result = communicator.process_whatsapp_event(payload)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify(status="ok"), 200
+    return json_response({"status": "ok"})
 
 if __name__ == "__main__":
     debug = os.getenv("FLASK_DEBUG", "false").lower() == "true"
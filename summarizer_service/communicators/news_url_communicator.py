@@ -1,33 +1,74 @@
+import hashlib
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
+from cachetools import TTLCache
 
+from web_page_fetchers.http_web_page_fetcher import HttpFetcher
 from web_page_fetchers.playwright_web_page_fetcher import PlaywrightFetcher
 from extractors.base_extractor import ArticleTextExtractor
 from summarizers.base_summarizer import Summarizer
 from runtime_config import runtime_config
 from shared.auth_service import authorize_admin_command
+from shared.gateway_http import gateway_session
 from shared.runtime_config import assistant_mode_enabled, whatsapp_gateway_url
 
 logger = logging.getLogger(__name__)
 
+_URL_RE = re.compile(r"https?://\S+")
+_BOT_RE = re.compile(r"@bot", re.IGNORECASE)
+
+# Below this many characters the plain HTTP result is treated as a JS shell
+# or teaser and the page is rendered with Playwright instead.
+MIN_ARTICLE_CHARS = 800
+
+SETUP_COMMANDS = frozenset({"!setup summarizer", "!stop summarizer"})
+
+
+def _canonical_url(url: str) -> str:
+    """Cache key for a link: no fragment, lowercase host, sorted query params."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
 
 class UrlCommunicator:
-    URL_REGEX = r"https?://[^\s]+"
+    URL_REGEX = _URL_RE
 
     def __init__(self, extractor: ArticleTextExtractor, summarizer: Summarizer):
         self.extractor = extractor
         self.summarizer = summarizer
+        self.http_fetcher = HttpFetcher()
         self.fetcher = PlaywrightFetcher()
+        # Duplicate forwards of the same link skip the fetch entirely.
+        self._page_cache: TTLCache = TTLCache(maxsize=512, ttl=600)
+        self._page_cache_lock = threading.Lock()
+        # Finished summaries, keyed by canonical URL and by a digest of the
+        # article text so mirrors of the same story reuse one OpenAI call.
+        self._summary_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+        self._summary_cache_lock = threading.Lock()
         self.gateway_url = whatsapp_gateway_url()
+        self._send_url = f"{self.gateway_url.rstrip('/')}/send"
+        self.session = gateway_session()
+        # Fetching and summarizing take seconds; run them off the request thread.
+        # The summarizer caps how many OpenAI calls of these run at once.
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="summarize")
 
     def extract_url(self, text: str) -> Optional[str]:
-        match = re.search(self.URL_REGEX, text)
-        if match:
-            logger.info("Extracted URL: %s", match.group(0))
-        return match.group(0) if match else None
+        # Most chat messages carry no link; skip the regex engine for them.
+        if "http" not in text:
+            return None
+        match = _URL_RE.search(text)
+        if not match:
+            return None
+        url = match.group(0)
+        logger.debug("Extracted URL: %s", url)
+        return url
 
     def process_whatsapp_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         chat_id = payload.get("chat_id")
@@ -36,62 +77,70 @@ class UrlCommunicator:
         sender_id = payload.get("sender_id") or ""
         assistant_mode = assistant_mode_enabled()
 
-        normalized = text.strip().lower()
-
-        if normalized in {"!setup summarizer", "!stop summarizer"}:
+        stripped = text.strip()
+        # Only "!" messages can be commands; skip the lowercase copy for the rest.
+        command = stripped.lower() if stripped.startswith("!") else ""
+        if command in SETUP_COMMANDS:
             if assistant_mode:
                 logger.info("Ignored setup command in assistant mode chat_id=%s", chat_id)
                 return {"status": "ok", "accepted": False, "reason": "setup_not_required"}
-            return self._handle_setup_command(chat_id, sender_id, normalized)
+            return self._handle_setup_command(chat_id, sender_id, command)
+
+        reason = runtime_config.event_validator()(payload)
+        if reason:
+            logger.info(
+                "Rejected whatsapp event: %s chat_id=%s sender_id=%s",
+                reason,
+                chat_id,
+                sender_id,
+            )
+            return {"status": "ok", "accepted": False, "reason": reason}
 
         if assistant_mode:
-            if not runtime_config.is_sender_approved(sender_id):
-                logger.info(
-                    "Rejected whatsapp event: unauthorized_sender chat_id=%s sender_id=%s",
-                    chat_id,
-                    sender_id,
-                )
-                return {"status": "ok", "accepted": False, "reason": "unauthorized_sender"}
-            input_text = quoted_text.strip() if quoted_text else text.strip()
+            input_text = quoted_text.strip() if quoted_text else stripped
         else:
-            allowed_groups = set(runtime_config.allowed_groups())
-            if chat_id not in allowed_groups:
-                logger.info("Rejected whatsapp event: unauthorized_group chat_id=%s", chat_id)
-                return {"status": "ok", "accepted": False, "reason": "unauthorized_group"}
-
-            if "@bot" not in text.lower():
+            if not _BOT_RE.search(text):
                 logger.info("Ignored whatsapp event: no_bot_tag chat_id=%s", chat_id)
                 return {"status": "ok", "accepted": False, "reason": "no_bot_tag"}
 
-            cleaned = re.sub(r"@bot", "", text, flags=re.IGNORECASE).strip()
+            cleaned = _BOT_RE.sub("", text).strip()
             input_text = quoted_text.strip() if quoted_text else cleaned
 
         if not self.extract_url(input_text):
             logger.info("Ignored whatsapp event: no_url chat_id=%s", chat_id)
             return {"status": "ok", "accepted": False, "reason": "no_url"}
 
-        logger.info(
-            "Accepted whatsapp event: chat_id=%s, assistant_mode=%s, input_length=%s",
-            chat_id,
-            assistant_mode,
-            len(input_text),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Accepted whatsapp event: chat_id=%s, assistant_mode=%s, input_length=%s",
+                chat_id,
+                assistant_mode,
+                len(input_text),
+            )
 
         self._send_whatsapp(chat_id, "⏳ Summarizing...")
-        result = self._summarize_text(input_text)
+        self._executor.submit(self._summarize_and_reply, chat_id, input_text)
+        return {"status": "ok", "accepted": True, "reason": None}
+
+    def _summarize_and_reply(self, chat_id: str, input_text: str) -> None:
+        try:
+            result = self._summarize_text(input_text)
+        except Exception:
+            logger.exception("Unexpected summarize failure chat_id=%s", chat_id)
+            result = {"status": "error"}
         if result.get("status") == "ok":
             reply = result.get("summary") or "✅ Done"
-            logger.info(
-                "Sending summary to gateway: chat_id=%s, preview=%r",
-                chat_id,
-                reply[:120],
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Sending summary to gateway: chat_id=%s, preview=%r",
+                    chat_id,
+                    reply[:120],
+                )
             self._send_whatsapp(chat_id, reply)
-            return {"status": "ok", "accepted": True, "reason": None}
+            return
 
         error_msg = result.get("message") or "Could not process request"
         self._send_whatsapp(chat_id, f"⚠️ Error: {error_msg}")
-        return {"status": "ok", "accepted": False, "reason": result.get("type") or "error"}
 
     def _handle_setup_command(self, chat_id: str, sender_id: str, command: str) -> Dict[str, Any]:
         reason = authorize_admin_command(
@@ -118,15 +167,22 @@ class UrlCommunicator:
             logger.error("Error processing request: %s", error_msg)
             return {"status": "error", "message": error_msg}
 
+        url_key = _canonical_url(url)
+        with self._summary_cache_lock:
+            summary = self._summary_cache.get(url_key)
+        if summary is not None:
+            logger.info("Using cached summary: %s", url)
+            return {"status": "ok", "url": url, "summary": summary}
+
         # Try extracting page
         try:
-            html = self.fetcher.fetch(url)
-            page_title, page_text = self.extractor.extract(html)
-            logger.info(
-                "Extracted page content: title=%r, text_length=%s",
-                page_title,
-                len(page_text or ""),
-            )
+            page_title, page_text = self._fetch_and_extract(url)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Extracted page content: title=%r, text_length=%s",
+                    page_title,
+                    len(page_text or ""),
+                )
         except Exception as e:
             logger.exception("Extraction failed for URL: %s", url)
             return {
@@ -136,10 +192,19 @@ class UrlCommunicator:
                 "url": url,
             }
 
+        text_key = hashlib.blake2b(
+            (page_text or "").encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        with self._summary_cache_lock:
+            summary = self._summary_cache.get(text_key)
+
         # Try summarizing page
         try:
-            summary = self.summarizer.summarize(page_text)
-            logger.info("Summary generated: length=%s", len(summary or ""))
+            if summary is None:
+                summary = self.summarizer.summarize(page_text)
+                logger.debug("Summary generated: length=%s", len(summary or ""))
+            else:
+                logger.info("Using cached summary for identical article text: %s", url)
         except Exception as e:
             logger.exception("Summarization failed for URL: %s", url)
             return {
@@ -149,6 +214,11 @@ class UrlCommunicator:
                 "url": url,
             }
 
+        if summary:
+            with self._summary_cache_lock:
+                self._summary_cache[url_key] = summary
+                self._summary_cache[text_key] = summary
+
         logger.info("Successfully processed URL: %s", url)
         return {
             "status": "ok",
@@ -156,12 +226,52 @@ class UrlCommunicator:
             "summary": summary,
         }
 
+    def _fetch_and_extract(self, url: str) -> tuple[str, str]:
+        # Same key as the summary cache, so tracking-param variants share a fetch.
+        url_key = _canonical_url(url)
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url_key)
+        if cached is not None:
+            logger.info("Using cached page content: %s", url)
+            return cached
+
+        page_title, page_text = self._fetch_page(url)
+        if page_text:
+            with self._page_cache_lock:
+                self._page_cache[url_key] = (page_title, page_text)
+        return page_title, page_text
+
+    def _fetch_page(self, url: str) -> tuple[str, str]:
+        # Most news sites render server-side, so try a plain HTTP fetch first
+        # and only pay for a headless browser when that yields no article.
+        page_title, page_text = "", ""
+        try:
+            page_title, page_text = self.extractor.extract(self.http_fetcher.fetch(url))
+            if len(page_text or "") >= MIN_ARTICLE_CHARS:
+                return page_title, page_text
+            logger.info("HTTP fetch had too little article text, falling back to Playwright: %s", url)
+        except Exception as exc:
+            # Network errors, bad status codes and undecodable or unparsable
+            # pages all get a second chance in the browser.
+            logger.info("HTTP fetch failed, falling back to Playwright: %s (%s)", url, exc)
+
+        try:
+            rendered_title, rendered_text = self.extractor.extract(self.fetcher.fetch(url))
+        except Exception:
+            if page_text:
+                logger.warning("Playwright fetch failed, using short HTTP result: %s", url, exc_info=True)
+                return page_title, page_text
+            raise
+        if len(rendered_text or "") >= len(page_text or ""):
+            return rendered_title or page_title, rendered_text
+        return page_title, page_text
+
     def _send_whatsapp(self, chat_id: str, text: str) -> None:
         if not chat_id or not text:
             return
         try:
-            resp = requests.post(
-                f"{self.gateway_url}/send",
+            resp = self.session.post(
+                self._send_url,
                 json={"to": chat_id, "text": text},
                 timeout=5,
             )
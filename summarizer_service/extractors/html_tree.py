@@ -0,0 +1,18 @@
+from typing import Optional
+
+from lxml import etree, html as lxml_html
+
+
+def parse_html(html: str) -> Optional[lxml_html.HtmlElement]:
+    """
+    Parse HTML once with lxml's C parser; None for empty documents.
+
+    The tree is shared by Trafilatura and the <title> lookup, so a page is
+    tokenized a single time.
+
+    The text is already decoded, so the bytes are fed back as UTF-8 and any
+    charset declared inside the page is ignored.
+    """
+    # lxml parsers must not be shared between threads; one is cheap to build.
+    parser = lxml_html.HTMLParser(encoding="utf-8")
+    return etree.fromstring(html.encode("utf-8", "surrogatepass"), parser)
@@ -1,50 +1,58 @@
-import json
 import logging
+import re
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+from lxml.html import HtmlElement
 
 from extractors.base_extractor import ArticleTextExtractor
+from extractors.html_tree import parse_html
+from shared import json_codec
 
 
-ARTICLE_TYPES = {
+ARTICLE_TYPES = frozenset({
     "Article",
     "NewsArticle",
     "ReportageNewsArticle",
     "AnalysisNewsArticle",
-}
+})
 
 logger = logging.getLogger(__name__)
 
+# JSON-LD blocks are delimited script tags; a scan finds them without building a DOM.
+_LD_SCRIPT_RE = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 class JsonLDExtractor(ArticleTextExtractor):
 
-    def extract(self, html: str) -> tuple[str, str]:
+    def extract(self, html: str, tree: Optional[HtmlElement] = None) -> tuple[str, str]:
         """
         Returns (title, text) if found, else ("", "").
+
+        Pass `tree` to reuse an already parsed document.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        scripts = soup.find_all("script", type="application/ld+json")
+        scripts = self._script_texts(html, tree)
 
-        logger.info("JSON-LD scripts found: %d", len(scripts))
+        logger.debug("JSON-LD scripts found: %d", len(scripts))
 
         for idx, script in enumerate(scripts):
             try:
-                data = json.loads(script.string)
-            except Exception:
+                data = json_codec.loads(script)
+            except ValueError:
                 continue
 
             # JSON-LD can be a list or a single dict
-            candidates = data if isinstance(data, list) else [data]
+            if isinstance(data, dict):
+                candidates = (data,)
+            elif isinstance(data, list):
+                candidates = data
+            else:
+                continue
 
             for obj in candidates:
-                if not isinstance(obj, dict):
-                    continue
-
-                obj_type = obj.get("@type")
-                if isinstance(obj_type, list):
-                    obj_type = obj_type[0]
-
-                if obj_type not in ARTICLE_TYPES:
+                if not isinstance(obj, dict) or not self._is_article(obj):
                     continue
 
                 body = obj.get("articleBody")
@@ -60,3 +68,27 @@ class JsonLDExtractor(ArticleTextExtractor):
 
         logger.info("No usable JSON-LD article found")
         return "", ""
+
+    @staticmethod
+    def _is_article(obj: dict) -> bool:
+        obj_type = obj.get("@type")
+        if isinstance(obj_type, list):
+            obj_type = obj_type[0] if obj_type else None
+        return isinstance(obj_type, str) and obj_type in ARTICLE_TYPES
+
+    @staticmethod
+    def _script_texts(html: str, tree: Optional[HtmlElement]) -> List[str]:
+        if tree is not None:
+            return [
+                node.text
+                for node in tree.iterfind('.//script[@type="application/ld+json"]')
+                if node.text
+            ]
+        scripts = _LD_SCRIPT_RE.findall(html)
+        if scripts or "ld+json" not in html:
+            return scripts
+        # Markup the scan can't follow (e.g. a '>' inside another attribute).
+        tree = parse_html(html)
+        if tree is None:
+            return []
+        return JsonLDExtractor._script_texts(html, tree)
@@ -1,48 +1,89 @@
+import hashlib
 import logging
+import threading
 
 import trafilatura
-from bs4 import BeautifulSoup
+from cachetools import LRUCache
 
 from extractors.base_extractor import ArticleTextExtractor
+from extractors.html_tree import parse_html
 from extractors.json_ld_extractor import JsonLDExtractor
 
 logger = logging.getLogger(__name__)
 
 class TrafilaturaArticleTextExtractor(ArticleTextExtractor):
 
+    def __init__(self, cache_size: int = 1024) -> None:
+        # Keyed by a digest of the HTML so retries and re-forwarded links skip re-parsing.
+        self._cache: LRUCache = LRUCache(maxsize=cache_size)
+        self._cache_lock = threading.Lock()
+
     def extract(self, html):
+        key = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._extract(html)
+        with self._cache_lock:
+            self._cache[key] = result
+        return result
+
+    def _extract(self, html):
         title = ""
 
-        # 1️⃣ Extract <title> tag
+        # 1️⃣ A publisher's JSON-LD article body is authoritative and found by a
+        # cheap scan, so try it before Trafilatura's DOM scoring
+        json_ld_title, json_ld_text = "", ""
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            if soup.title and soup.title.string:
-                title = soup.title.string.strip()
+            json_ld_title, json_ld_text = JsonLDExtractor().extract(html)
         except Exception as e:
-            logger.warning("Failed to extract <title>: %s", e)
+            logger.warning("JSON-LD extraction failed: %s", e)
+        json_ld_title = (json_ld_title or "").strip()
+        if len(json_ld_text or "") > 800:
+            return json_ld_title, json_ld_text
 
-        # 2️⃣ Extract main article text via Trafilatura
+        tree = None
         try:
-            text = trafilatura.extract(html)
+            tree = parse_html(html)
+        except Exception as e:
+            logger.warning("HTML parsing failed: %s", e)
+
+        # 2️⃣ Extract title and main article text in a single Trafilatura pass
+        document = None
+        if tree is not None:
+            try:
+                document = trafilatura.bare_extraction(
+                    tree,
+                    include_comments=False,
+                    with_metadata=True,
+                )
+            except Exception as e:
+                logger.warning("Trafilatura extraction failed: %s", e)
+
+        if document is not None:
+            title = (document.title or "").strip()
+            text = document.text or ""
             if text:
                 logger.info("Trafilatura extracted %s characters", len(text))
                 if len(text) > 800:
                     return title, text
-        except Exception as e:
-            logger.warning("Trafilatura extraction failed: %s", e)
-            
-        logger.warning("Very short text or extraction failed, attempting JSON-LD fallback")
-        
-        # 3️⃣ Fallback to JSON-LD
-        try:
-            json_ld_title, json_ld_text = JsonLDExtractor().extract(html)
-            if json_ld_text:
-                # Use JSON-LD title if we didn't find one earlier
-                final_title = title if title else json_ld_title
-                return final_title, json_ld_text
-        except Exception as e:
-            logger.warning("JSON-LD extraction failed: %s", e)
+        else:
+            # Trafilatura gave up entirely; still try the <title> tag
+            title = self._extract_title_tag(tree)
+
+        # 3️⃣ Shorter JSON-LD body still beats a too-short Trafilatura result
+        if json_ld_text:
+            logger.warning("Very short text or extraction failed, using JSON-LD article")
+            return title or json_ld_title, json_ld_text
 
         # 4️⃣ Final fallback: return title only (or empty)
         logger.warning("No text could be extracted")
         return title, ""
+
+    @staticmethod
+    def _extract_title_tag(tree) -> str:
+        if tree is None:
+            return ""
+        return (tree.findtext(".//title") or "").strip()
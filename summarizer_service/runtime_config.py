@@ -1,8 +1,14 @@
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List
-
-from shared.runtime_config import CommonRuntimeConfig, JsonFileConfig
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from shared.runtime_config import (
+    CommonRuntimeConfig,
+    JsonFileConfig,
+    assistant_mode_enabled,
+    common_runtime_config,
+    normalize_sender_id,
+)
 
 
 DEFAULT_SUMMARIZER_CONFIG_PATH = os.getenv(
@@ -10,39 +16,99 @@ DEFAULT_SUMMARIZER_CONFIG_PATH = os.getenv(
 )
 
 
+EventValidator = Callable[[Dict[str, Any]], Optional[str]]
+
+
+def _compile_validator(
+    assistant_mode: bool,
+    approved_numbers: frozenset[str],
+    allowed_groups: frozenset[str],
+) -> EventValidator:
+    """
+    Build the sender/group policy check for the active mode.
+
+    Returns a function mapping an event payload to a rejection reason, or None
+    when the event passes. The mode and sets are bound once per config change.
+    """
+    if assistant_mode:
+        def validate(payload: Dict[str, Any]) -> Optional[str]:
+            normalized = normalize_sender_id(payload.get("sender_id") or "")
+            if normalized and normalized in approved_numbers:
+                return None
+            return "unauthorized_sender"
+    else:
+        def validate(payload: Dict[str, Any]) -> Optional[str]:
+            if payload.get("chat_id") in allowed_groups:
+                return None
+            return "unauthorized_group"
+    return validate
+
+
 class SummarizerRuntimeConfig(JsonFileConfig):
     def __init__(
         self,
         path: str = DEFAULT_SUMMARIZER_CONFIG_PATH,
         common: CommonRuntimeConfig | None = None,
     ) -> None:
-        self._common = common or CommonRuntimeConfig()
+        self._common = common or common_runtime_config()
+        self._validator_key: tuple | None = None
+        self._validator: EventValidator | None = None
         super().__init__(path, debug_label="summarizer_config")
 
+    def event_validator(self) -> EventValidator:
+        """Policy check for inbound events, rebuilt only when its inputs change."""
+        self._refresh_if_changed()
+        assistant_mode = assistant_mode_enabled()
+        approved = self._common.approved_set()
+        groups = self._allowed_groups
+        key = self._validator_key
+        validator = self._validator
+        if (
+            validator is None
+            or key[0] != assistant_mode
+            or key[1] is not approved
+            or key[2] is not groups
+        ):
+            validator = _compile_validator(assistant_mode, approved, groups)
+            self._validator_key = (assistant_mode, approved, groups)
+            self._validator = validator
+        return validator
+
     def admin_sender_id(self) -> str:
         return self._common.admin_sender_id()
 
+    def _on_data_changed(self) -> None:
+        # Group membership is checked per event; rebuild only on reload or write.
+        self._allowed_groups = frozenset(self._data.get("allowed_groups") or ())
+
     def allowed_groups(self) -> List[str]:
         self._refresh_if_changed()
         return list(self._data.get("allowed_groups") or [])
 
+    def allowed_groups_set(self) -> frozenset[str]:
+        self._refresh_if_changed()
+        return self._allowed_groups
+
     def add_allowed_group(self, group_id: str) -> None:
         with self._lock:
-            data = self._load_from_disk()
-            groups = list(data.get("allowed_groups") or [])
-            if group_id not in groups:
-                groups.append(group_id)
-            data["allowed_groups"] = groups
+            self._refresh_if_changed()
+            if group_id in self._allowed_groups:
+                return
+            data = self._load_for_update()
+            data["allowed_groups"] = list(data.get("allowed_groups") or []) + [group_id]
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def remove_allowed_group(self, group_id: str) -> None:
         with self._lock:
-            data = self._load_from_disk()
+            self._refresh_if_changed()
+            if group_id not in self._allowed_groups:
+                return
+            data = self._load_for_update()
             groups = list(data.get("allowed_groups") or [])
             data["allowed_groups"] = [g for g in groups if g != group_id]
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def normalize_sender_id(self, sender_id: str) -> str:
         return self._common.normalize_sender_id(sender_id)
@@ -50,7 +116,7 @@ class SummarizerRuntimeConfig(JsonFileConfig):
     def is_sender_approved(self, sender_id: str) -> bool:
         return self._common.is_sender_approved(sender_id)
 
-    def instructions(self) -> dict[str, str]:
+    def instructions(self) -> Mapping[str, str]:
         return self._common.instructions()
 
     def set_instruction(self, service_name: str, instruction: str) -> None:
@@ -72,6 +138,21 @@ class SummarizerRuntimeConfig(JsonFileConfig):
             return 1000
         return max(1, value)
 
+    def openai_rpm_limit(self) -> int:
+        return self._env_limit("OPENAI_RPM_LIMIT")
+
+    def openai_tpm_limit(self) -> int:
+        return self._env_limit("OPENAI_TPM_LIMIT")
+
+    @staticmethod
+    def _env_limit(name: str) -> int:
+        raw = os.getenv(name, "0").strip()
+        try:
+            value = int(raw)
+        except ValueError:
+            return 0
+        return max(0, value)
+
     def reserve_openai_tokens(self, estimate: int) -> tuple[bool, int, int]:
         budget = self.openai_daily_token_budget()
         if budget <= 0:
@@ -80,30 +161,13 @@ class SummarizerRuntimeConfig(JsonFileConfig):
         reserved = max(0, int(estimate))
         today = datetime.now(timezone.utc).date().isoformat()
         with self._lock:
-            data = self._load_from_disk()
-            usage = data.get("openai_usage")
-            if not isinstance(usage, dict):
-                usage = {}
-
-            usage_date = str(usage.get("date") or "")
-            used_raw = usage.get("tokens_used")
-            try:
-                used = int(used_raw)
-            except (TypeError, ValueError):
-                used = 0
-
-            if usage_date != today:
-                used = 0
-
+            self._refresh_if_changed()
+            used = self._tokens_used_today(today)
             if used + reserved > budget:
-                data["openai_usage"] = {"date": today, "tokens_used": used}
-                self._data = data
                 return False, used, budget
 
             used += reserved
-            data["openai_usage"] = {"date": today, "tokens_used": used}
-            self._write_to_disk(data)
-            self._data = data
+            self._record_tokens_used(today, used)
             return True, used, budget
 
     def reconcile_openai_tokens(self, reserved: int, actual: int) -> None:
@@ -115,25 +179,24 @@ class SummarizerRuntimeConfig(JsonFileConfig):
         actual = max(0, int(actual))
         today = datetime.now(timezone.utc).date().isoformat()
         with self._lock:
-            data = self._load_from_disk()
-            usage = data.get("openai_usage")
-            if not isinstance(usage, dict):
-                usage = {}
-
-            usage_date = str(usage.get("date") or "")
-            used_raw = usage.get("tokens_used")
-            try:
-                used = int(used_raw)
-            except (TypeError, ValueError):
-                used = 0
-
-            if usage_date != today:
-                used = 0
-
-            used = max(0, used - reserved + actual)
-            data["openai_usage"] = {"date": today, "tokens_used": used}
-            self._write_to_disk(data)
-            self._data = data
+            self._refresh_if_changed()
+            used = self._tokens_used_today(today)
+            self._record_tokens_used(today, max(0, used - reserved + actual))
+
+    def _tokens_used_today(self, today: str) -> int:
+        usage = self._data.get("openai_usage")
+        if not isinstance(usage, dict) or str(usage.get("date") or "") != today:
+            return 0
+        try:
+            return int(usage.get("tokens_used"))
+        except (TypeError, ValueError):
+            return 0
+
+    def _record_tokens_used(self, today: str, used: int) -> None:
+        data = self._load_for_update()
+        data["openai_usage"] = {"date": today, "tokens_used": used}
+        self._write_to_disk(data)
+        self._set_data(data)
 
     def _default_data(self) -> Dict[str, Any]:
         return {
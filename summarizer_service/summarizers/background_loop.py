@@ -0,0 +1,43 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """
+    An asyncio event loop running forever on a daemon thread.
+
+    Lets synchronous callers (Flask/gunicorn worker threads) share async
+    clients whose connection pools are bound to a single loop.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(self, coro: Coroutine[object, object, T]) -> "Future[T]":
+        """Schedule a coroutine on the loop without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro: Coroutine[object, object, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and block until it completes."""
+        return self.submit(coro).result(timeout=timeout)
+
+    @property
+    def started(self) -> bool:
+        """Whether the loop thread has been started by a submit()."""
+        with self._lock:
+            return self._loop is not None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name=self._name, daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
@@ -1,68 +1,175 @@
+import asyncio
+import functools
+import hashlib
 import logging
+import os
+from typing import AsyncIterator
 
-from openai import OpenAI, OpenAIError
+import httpx
+from aiolimiter import AsyncLimiter
+from cachetools import LRUCache
+from openai import AsyncOpenAI, DefaultAioHttpClient, DefaultAsyncHttpxClient, OpenAIError, Timeout
 
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+from shared import json_codec
+from summarizers.background_loop import BackgroundLoop
 from summarizers.base_summarizer import Summarizer
 from runtime_config import runtime_config
 
 logger = logging.getLogger(__name__)
 
+MODEL = "gpt-4o-mini"
+SYSTEM_PROMPT = (
+    "You are an assistant that summarizes news articles. "
+    "Write the summary in the same language as the original article. "
+    "Do not translate the text and do not mention the article's language."
+)
+# Shared by every request; an identical leading message also keeps OpenAI's
+# prompt cache hitting.
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+USER_PROMPT_PREFIX = "Summarize the following article in a few short sentences:\n"
+
+# Completions in flight at once across all callers.
+MAX_CONCURRENT_REQUESTS = 8
+
+# Keep warm connections to the API between summaries instead of re-handshaking.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+HTTP_TIMEOUT = Timeout(60.0, connect=5.0)
+
+# Opt-in micro-batching: summarize() calls arriving within this window share one
+# request. 0 keeps one request per article.
+BATCH_WINDOW_SECONDS = float(os.getenv("OPENAI_BATCH_WINDOW_MS", "0")) / 1000
+MAX_BATCH_ARTICLES = 5
+BATCH_USER_PROMPT = (
+    "Summarize each of the following articles separately in a few short sentences. "
+    'Reply with a JSON object {"summaries": [...]} holding one summary string per '
+    "article, in the same order.\n"
+)
+
+# Chat framing around each prompt: a few tokens per message plus the reply primer.
+CHAT_FRAMING_TOKENS = 3 * 2 + 3
+
+# "aiohttp" swaps httpx for aiohttp under the SDK; needs the openai[aiohttp] extra.
+OPENAI_HTTP_CLIENT = os.getenv("OPENAI_HTTP_CLIENT", "httpx").strip().lower()
+
 
 class GPTSummarizer(Summarizer):
+    """
+    Summarizes with AsyncOpenAI on a shared background loop.
+
+    Worker threads block on summarize() while the loop overlaps their OpenAI
+    round trips over one connection pool.
+    """
 
     def __init__(self) -> None:
-        self.client = OpenAI()
+        self.client = AsyncOpenAI(timeout=HTTP_TIMEOUT, http_client=self._build_http_client())
+        self._loop = BackgroundLoop("openai")
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Touched only from the loop thread.
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._inflight: dict[bytes, asyncio.Task] = {}
+        # Token counts by hash(text), also touched only from the loop thread.
+        self._token_counts: LRUCache = LRUCache(maxsize=4096)
+        # Load the tokenizer here rather than on the first request, on the loop.
+        _encoding()
+        # Pace requests to the account limits up front instead of eating 429 backoff.
+        rpm = runtime_config.openai_rpm_limit()
+        tpm = runtime_config.openai_tpm_limit()
+        self._rpm_limiter = AsyncLimiter(rpm, 60) if rpm else None
+        self._tpm_limiter = AsyncLimiter(tpm, 60) if tpm else None
 
     def summarize(self, text: str) -> str:
+        if BATCH_WINDOW_SECONDS > 0:
+            return self._loop.run(self._summarize_coalesced(text))
+        return self._loop.run(self.summarize_async(text))
+
+    def summarize_many(self, texts: list[str]) -> list[str]:
+        return self._loop.run(self.summarize_many_async(texts))
+
+    @staticmethod
+    def _build_http_client():
+        if OPENAI_HTTP_CLIENT == "aiohttp":
+            try:
+                # aiohttp holds up better than httpx with many requests in flight.
+                return DefaultAioHttpClient()
+            except RuntimeError as exc:
+                logger.warning("aiohttp OpenAI client unavailable, using httpx: %s", exc)
+        return DefaultAsyncHttpxClient(limits=HTTP_LIMITS, http2=True)
+
+    def close(self) -> None:
+        """Close pooled API connections; the loop thread itself is a daemon."""
+        self._loop.run(self.client.close())
+
+    async def summarize_async(self, text: str) -> str:
+        if not text:
+            raise ValueError("Text cannot be empty")
+
+        # Callers asking for an article that is already being summarized wait
+        # for that request instead of paying for a second one.
+        key = self._inflight_key(text, runtime_config.openai_max_completion_tokens())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._collect_summary(text))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _collect_summary(self, text: str) -> str:
+        parts = [part async for part in self.stream_summary(text)]
+        return "".join(parts)
+
+    async def stream_summary(self, text: str) -> AsyncIterator[str]:
+        """
+        Yield the summary as the model generates it.
+
+        For async callers that can forward text before the completion ends.
+        """
         if not text:
             raise ValueError("Text cannot be empty")
 
         max_completion_tokens = runtime_config.openai_max_completion_tokens()
         estimated_prompt_tokens = self._estimate_prompt_tokens(text)
         reserved_tokens = estimated_prompt_tokens + max_completion_tokens
-        allowed, used, budget = runtime_config.reserve_openai_tokens(reserved_tokens)
-        if not allowed:
-            raise ValueError(
-                "Daily OpenAI token budget reached "
-                f"({used}/{budget}). Try again tomorrow or raise OPENAI_DAILY_TOKEN_BUDGET."
-            )
-            
+        await self._reserve_tokens(reserved_tokens)
+
         logger.debug("Input length: %s", len(text))
         actual_tokens = 0
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an assistant that summarizes news articles. "
-                            "Write the summary in the same language as the original article. "
-                            "Do not translate the text and do not mention the article's language."
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Summarize the following article in a few short sentences:\n{text}"
-                    }
-                ],
-                max_completion_tokens=max_completion_tokens
-            )
+            parts: list[str] = []
+            await self._throttle(reserved_tokens)
+            async with self._semaphore:
+                stream = await self.client.chat.completions.create(
+                    model=MODEL,
+                    messages=[
+                        SYSTEM_MESSAGE,
+                        {"role": "user", "content": USER_PROMPT_PREFIX + text},
+                    ],
+                    max_completion_tokens=max_completion_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                # Usage comes on the last chunk.
+                async for chunk in stream:
+                    if chunk.usage is not None:
+                        actual_tokens = int(chunk.usage.total_tokens or 0)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                        yield chunk.choices[0].delta.content
 
             logger.debug("OpenAI response received")
 
-            usage = getattr(response, "usage", None)
-            if usage is not None:
-                actual_tokens = int(getattr(usage, "total_tokens", 0) or 0)
-
-            if not response.choices or not response.choices[0].message.content:
+            summary = "".join(parts)
+            if not summary:
                 raise ValueError("OpenAI returned an empty response")
-                
-            summary = response.choices[0].message.content
-            logger.debug("Summary length: %s", len(summary))
-            logger.debug("Summary text: %s", summary)
-            return summary
-            
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Summary length: %s", len(summary))
+                logger.debug("Summary text: %s", summary)
+
         except OpenAIError as e:
             logger.exception("OpenAI API error: %s", e)
             raise  # Re-raise to be caught by the communicator
@@ -70,11 +177,184 @@ class GPTSummarizer(Summarizer):
             logger.exception("Unexpected error in GPTSummarizer: %s", e)
             raise
         finally:
-            runtime_config.reconcile_openai_tokens(
-                reserved=reserved_tokens,
-                actual=actual_tokens,
+            await self._reconcile_tokens(reserved_tokens, actual_tokens)
+
+    async def summarize_many_async(self, texts: list[str]) -> list[str]:
+        """
+        Summarize several articles, packing them into shared requests.
+
+        Results keep the order of `texts`. A batch whose reply can't be split
+        back into one summary per article is retried one article at a time.
+        """
+        if any(not text for text in texts):
+            raise ValueError("Text cannot be empty")
+
+        results = await self._summarize_each(texts)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _summarize_each(self, texts: list[str]) -> list[str | BaseException]:
+        """Like summarize_many_async, but each article's failure stays in its own slot."""
+        max_completion_tokens = runtime_config.openai_max_completion_tokens()
+        results: list[str | BaseException | None] = [None] * len(texts)
+        chunks = [
+            list(range(start, min(start + MAX_BATCH_ARTICLES, len(texts))))
+            for start in range(0, len(texts), MAX_BATCH_ARTICLES)
+        ]
+        summaries = await asyncio.gather(
+            *(self._summarize_chunk([texts[i] for i in chunk], max_completion_tokens) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for chunk, chunk_summaries in zip(chunks, summaries):
+            if isinstance(chunk_summaries, BaseException):
+                # The shared request itself failed, so every article in it did.
+                chunk_summaries = [chunk_summaries] * len(chunk)
+            for i, summary in zip(chunk, chunk_summaries):
+                results[i] = summary
+        return results
+
+    async def _summarize_chunk(
+        self, texts: list[str], max_completion_tokens: int
+    ) -> list[str | BaseException]:
+        if len(texts) == 1:
+            return [await self.summarize_async(texts[0])]
+
+        reserved_tokens = (
+            sum(self._estimate_prompt_tokens(text) for text in texts)
+            + max_completion_tokens * len(texts)
+        )
+        await self._reserve_tokens(reserved_tokens)
+        articles = "\n\n".join(f"[{n}]\n{text}" for n, text in enumerate(texts, start=1))
+        actual_tokens = 0
+        summaries = None
+        try:
+            await self._throttle(reserved_tokens)
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
+                    model=MODEL,
+                    messages=[
+                        SYSTEM_MESSAGE,
+                        {"role": "user", "content": BATCH_USER_PROMPT + articles},
+                    ],
+                    max_completion_tokens=max_completion_tokens * len(texts),
+                    response_format={"type": "json_object"},
+                )
+            if response.usage is not None:
+                actual_tokens = int(response.usage.total_tokens or 0)
+            content = response.choices[0].message.content if response.choices else None
+            summaries = json_codec.loads(content or "{}").get("summaries")
+        except (ValueError, AttributeError) as exc:
+            logger.warning("Could not parse batched summaries: %s", exc)
+        finally:
+            await self._reconcile_tokens(reserved_tokens, actual_tokens)
+
+        if (
+            isinstance(summaries, list)
+            and len(summaries) == len(texts)
+            and all(isinstance(summary, str) and summary for summary in summaries)
+        ):
+            return summaries
+        logger.warning("Batched reply did not match %d articles; summarizing one by one", len(texts))
+        return list(await asyncio.gather(
+            *(self.summarize_async(text) for text in texts),
+            return_exceptions=True,
+        ))
+
+    async def _summarize_coalesced(self, text: str) -> str:
+        # Reject bad input here, before it can share a batch with other callers.
+        if not text:
+            raise ValueError("Text cannot be empty")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+        if len(self._pending) == 1:
+            await asyncio.sleep(BATCH_WINDOW_SECONDS)
+            batch, self._pending = self._pending, []
+            try:
+                results = await self._summarize_each([queued for queued, _ in batch])
+            except Exception as exc:
+                results = [exc] * len(batch)
+            for (_, waiter), result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    waiter.set_exception(result)
+                else:
+                    waiter.set_result(result)
+        return await future
+
+    async def _throttle(self, tokens: int) -> None:
+        if self._rpm_limiter is not None:
+            await self._rpm_limiter.acquire()
+        if self._tpm_limiter is not None:
+            # A single request may not ask for more than the whole bucket.
+            await self._tpm_limiter.acquire(min(tokens, self._tpm_limiter.max_rate))
+
+    @staticmethod
+    async def _reserve_tokens(reserved_tokens: int) -> None:
+        # The budget lives in the runtime config file; do its I/O in a worker
+        # thread so it doesn't stall every summary in flight on the loop.
+        allowed, used, budget = await asyncio.to_thread(runtime_config.reserve_openai_tokens, reserved_tokens)
+        if not allowed:
+            raise ValueError(
+                "Daily OpenAI token budget reached "
+                f"({used}/{budget}). Try again tomorrow or raise OPENAI_DAILY_TOKEN_BUDGET."
             )
 
+    @staticmethod
+    async def _reconcile_tokens(reserved_tokens: int, actual_tokens: int) -> None:
+        await asyncio.to_thread(
+            runtime_config.reconcile_openai_tokens,
+            reserved=reserved_tokens,
+            actual=actual_tokens,
+        )
+
+    @staticmethod
+    def _inflight_key(text: str, max_completion_tokens: int) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (MODEL, SYSTEM_PROMPT, USER_PROMPT_PREFIX, str(max_completion_tokens), text):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        return digest.digest()
+
     def _estimate_prompt_tokens(self, text: str) -> int:
-        # Quick conservative estimate without extra dependencies.
-        return max(1, int(len(text) / 3.5) + 120)
+        encoding = _encoding()
+        if encoding is None:
+            # Quick conservative estimate when tiktoken can't be loaded.
+            return max(1, int(len(text) / 3.5) + 120)
+
+        key = hash(text)
+        count = self._token_counts.get(key)
+        if count is None:
+            count = len(encoding.encode(text, disallowed_special=()))
+            self._token_counts[key] = count
+        return count + _prompt_overhead_tokens()
+
+
+@functools.lru_cache(maxsize=1)
+def get_summarizer() -> GPTSummarizer:
+    """The process-wide summarizer, so its client pool and limiters are built once."""
+    return GPTSummarizer()
+
+
+@functools.cache
+def _encoding():
+    """The tokenizer for MODEL, or None when tiktoken or its BPE file is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(MODEL)
+    except Exception as exc:
+        # The BPE file is downloaded on first use; offline hosts fall back to the heuristic.
+        logger.warning("tiktoken encoding unavailable, estimating prompt tokens: %s", exc)
+        return None
+
+
+@functools.cache
+def _prompt_overhead_tokens() -> int:
+    encoding = _encoding()
+    return (
+        len(encoding.encode(SYSTEM_PROMPT))
+        + len(encoding.encode(USER_PROMPT_PREFIX))
+        + CHAT_FRAMING_TOKENS
+    )
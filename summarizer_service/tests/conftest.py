@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The service imports its modules flat (it runs from its own directory).
+SERVICE_DIR = str(Path(__file__).resolve().parents[1])
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from shared.runtime_config import reset_config_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_cache():
+    reset_config_cache()
+    yield
+    reset_config_cache()
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from summarizers import gpt_summarizer
+
+
+class FakeCompletions:
+    def __init__(self, error=None, batch_reply=None):
+        self.calls = []
+        self.error = error
+        self.batch_reply = batch_reply
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        prompt = kwargs["messages"][1]["content"]
+        if kwargs.get("stream"):
+            return self._stream(prompt)
+        # The batch prompt numbers articles "[1]", "[2]", ...; echo one summary each.
+        count = prompt.count("\n[")
+        summaries = self.batch_reply or [f"summary {n}" for n in range(1, count + 1)]
+        return SimpleNamespace(
+            usage=SimpleNamespace(total_tokens=42),
+            choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps({"summaries": summaries})))],
+        )
+
+    @staticmethod
+    async def _stream(prompt):
+        if "bad article" in prompt:
+            raise RuntimeError("upstream rejected article")
+        yield SimpleNamespace(
+            usage=None,
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=f"single {prompt.splitlines()[-1]}"))],
+        )
+        yield SimpleNamespace(usage=SimpleNamespace(total_tokens=42), choices=[])
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(gpt_summarizer, "_encoding", lambda: None)
+    monkeypatch.setattr(gpt_summarizer, "BATCH_WINDOW_SECONDS", 0.05)
+    summarizer = gpt_summarizer.GPTSummarizer()
+    summarizer.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    return summarizer
+
+
+def _coalesce(summarizer, texts):
+    async def run():
+        return await asyncio.gather(
+            *(summarizer._summarize_coalesced(text) for text in texts),
+            return_exceptions=True,
+        )
+
+    return summarizer._loop.run(run())
+
+
+def test_calls_in_one_window_share_a_request_and_fan_out(summarizer):
+    results = _coalesce(summarizer, ["first article", "second article", "third article"])
+
+    assert results == ["summary 1", "summary 2", "summary 3"]
+    calls = summarizer.client.chat.completions.calls
+    assert len(calls) == 1
+    assert calls[0]["response_format"] == {"type": "json_object"}
+
+
+def test_request_failure_reaches_every_waiter(summarizer):
+    summarizer.client.chat.completions.error = RuntimeError("upstream down")
+
+    results = _coalesce(summarizer, ["first article", "second article"])
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+
+def test_empty_text_fails_only_its_own_caller(summarizer):
+    results = _coalesce(summarizer, ["first article", "", "second article"])
+
+    assert results[0] == "summary 1" and results[2] == "summary 2"
+    assert isinstance(results[1], ValueError)
+    assert len(summarizer.client.chat.completions.calls) == 1
+
+
+def test_one_by_one_fallback_keeps_each_callers_result(summarizer):
+    summarizer.client.chat.completions.batch_reply = ["only one summary"]
+
+    results = _coalesce(summarizer, ["first article", "bad article"])
+
+    assert results[0] == "single first article"
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_token_budget_file_io_runs_off_the_event_loop(summarizer, monkeypatch):
+    threads = []
+
+    def reserve(estimate):
+        threads.append(threading.current_thread())
+        return True, estimate, 10**9
+
+    def reconcile(reserved, actual):
+        threads.append(threading.current_thread())
+
+    monkeypatch.setattr(gpt_summarizer.runtime_config, "reserve_openai_tokens", reserve)
+    monkeypatch.setattr(gpt_summarizer.runtime_config, "reconcile_openai_tokens", reconcile)
+
+    _coalesce(summarizer, ["first article", "second article"])
+
+    assert len(threads) == 2
+    assert all(thread.name != "openai" for thread in threads)
@@ -0,0 +1,42 @@
+import json
+
+from extractors.html_tree import parse_html
+from extractors.json_ld_extractor import JsonLDExtractor
+
+
+BODY = "The central bank kept rates unchanged on Tuesday. " * 20
+
+
+def _page(*blocks):
+    scripts = "\n".join(
+        f'<script type="application/ld+json">{json.dumps(block)}</script>' for block in blocks
+    )
+    return f"<!doctype html><html><head><title>Site chrome</title>{scripts}</head><body><p>Teaser.</p></body></html>"
+
+
+ARTICLE_PAGE = _page(
+    {"@type": "WebSite", "name": "Example News"},
+    [
+        {"@type": "BreadcrumbList"},
+        {"@type": ["NewsArticle", "Thing"], "headline": "Rates held steady", "articleBody": BODY},
+    ],
+)
+
+
+def test_extracts_article_body_and_headline():
+    assert JsonLDExtractor().extract(ARTICLE_PAGE) == ("Rates held steady", BODY)
+
+
+def test_reuses_a_parsed_tree():
+    tree = parse_html(ARTICLE_PAGE)
+
+    assert JsonLDExtractor().extract(ARTICLE_PAGE, tree=tree) == ("Rates held steady", BODY)
+
+
+def test_ignores_non_articles_and_teaser_bodies():
+    page = _page(
+        {"@type": "WebSite", "articleBody": BODY},
+        {"@type": "NewsArticle", "headline": "Short", "articleBody": "Too short to summarize."},
+    )
+
+    assert JsonLDExtractor().extract(page) == ("", "")
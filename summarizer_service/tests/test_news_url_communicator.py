@@ -0,0 +1,91 @@
+import httpx
+import pytest
+
+from communicators.news_url_communicator import MIN_ARTICLE_CHARS, UrlCommunicator
+from web_page_fetchers.http_web_page_fetcher import _decode_html
+
+
+LONG_TEXT = "x" * MIN_ARTICLE_CHARS
+SHORT_TEXT = "teaser"
+
+
+class FakeExtractor:
+    """Treats the fetched "HTML" as the article text itself."""
+
+    def extract(self, html):
+        if html == "unparsable":
+            raise ValueError("bad markup")
+        return f"title of {html[:6]}", html
+
+
+class FakeFetcher:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def fetch(self, url):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _communicator(http_result, rendered_result):
+    communicator = UrlCommunicator(FakeExtractor(), summarizer=None)
+    communicator.http_fetcher = FakeFetcher(http_result)
+    communicator.fetcher = FakeFetcher(rendered_result)
+    return communicator
+
+
+def test_long_http_article_skips_playwright():
+    communicator = _communicator(LONG_TEXT, "rendered")
+
+    assert communicator._fetch_page("https://example.com/a")[1] == LONG_TEXT
+    assert communicator.fetcher.calls == 0
+
+
+@pytest.mark.parametrize(
+    "http_result",
+    [httpx.ConnectError("refused"), "unparsable", UnicodeDecodeError("utf-8", b"\xff", 0, 1, "bad")],
+)
+def test_any_http_path_failure_falls_back_to_playwright(http_result):
+    communicator = _communicator(http_result, LONG_TEXT)
+
+    assert communicator._fetch_page("https://example.com/a")[1] == LONG_TEXT
+    assert communicator.fetcher.calls == 1
+
+
+def test_short_http_article_keeps_the_longer_result():
+    communicator = _communicator(SHORT_TEXT, "tiny")
+
+    assert communicator._fetch_page("https://example.com/a")[1] == SHORT_TEXT
+    assert communicator.fetcher.calls == 1
+
+
+def test_short_http_article_survives_playwright_failure():
+    communicator = _communicator(SHORT_TEXT, RuntimeError("no browser"))
+
+    assert communicator._fetch_page("https://example.com/a")[1] == SHORT_TEXT
+
+
+def test_playwright_failure_without_http_result_raises():
+    communicator = _communicator(httpx.ConnectError("refused"), RuntimeError("no browser"))
+
+    with pytest.raises(RuntimeError):
+        communicator._fetch_page("https://example.com/a")
+
+
+def test_url_variants_share_one_page_fetch():
+    communicator = _communicator(LONG_TEXT, "rendered")
+
+    communicator._fetch_and_extract("https://Example.com/a?b=2&a=1#top")
+    communicator._fetch_and_extract("https://example.com/a?a=1&b=2")
+
+    assert communicator.http_fetcher.calls == 1
+
+
+def test_decode_html_honors_meta_charset():
+    page = '<html><head><meta charset="windows-1255"><title>שלום</title></head></html>'
+
+    assert _decode_html(page.encode("cp1255")) == page
+    assert _decode_html("<p>héllo</p>".encode("utf-8")) == "<p>héllo</p>"
@@ -0,0 +1,48 @@
+import codecs
+import re
+
+import httpx
+
+from web_page_fetchers.playwright_web_page_fetcher import USER_AGENT
+
+# Browsers look for <meta charset> / http-equiv declarations in the first 1024
+# bytes; allow a little slack for pages with long <head> preambles.
+_META_SNIFF_BYTES = 4096
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+
+
+class HttpFetcher:
+    """
+    Plain HTTP fetch for server-rendered pages.
+
+    Much cheaper than driving a browser; callers fall back to
+    PlaywrightFetcher when the returned HTML has no extractable article.
+    """
+
+    def __init__(self, timeout: float = 10.0) -> None:
+        self.client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=timeout,
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    def fetch(self, url: str) -> str:
+        response = self.client.get(url)
+        response.raise_for_status()
+        if response.charset_encoding:
+            return response.text
+        return _decode_html(response.content)
+
+
+def _decode_html(content: bytes) -> str:
+    """Decode a page without a Content-Type charset by its BOM or <meta charset>, else UTF-8."""
+    if content.startswith(codecs.BOM_UTF8):
+        return content.decode("utf-8-sig", errors="replace")
+    match = _META_CHARSET_RE.search(content, 0, _META_SNIFF_BYTES)
+    if match:
+        try:
+            return content.decode(match.group(1).decode("ascii"), errors="replace")
+        except LookupError:
+            pass
+    return content.decode("utf-8", errors="replace")
@@ -1,13 +1,173 @@
-import time
+import asyncio
+import atexit
+import logging
+import os
+from typing import Coroutine, List, Optional, TypeVar, Union
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Playwright,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+)
+
+from summarizers.background_loop import BackgroundLoop
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Only the document and scripts matter for article text.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-extensions",
+]
+
+# Upper bound on how long to let client-side rendering settle after DOMContentLoaded.
+SETTLE_TIMEOUT_MS = 2000
+
+# Pages rendered at once across all callers; each open page costs a renderer process.
+MAX_CONCURRENT_PAGES = max(1, int(os.getenv("PLAYWRIGHT_MAX_PAGES") or os.cpu_count() or 4))
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/123.0.0.0 Safari/537.36"
+)
+
+
+class PlaywrightPool:
+    """
+    Keeps one headless Chromium alive on a background event loop.
+
+    Fetches reuse the running browser instead of paying the cold start on
+    every call, and up to MAX_CONCURRENT_PAGES pages load concurrently on the
+    same loop.
+    Each fetch gets its own short-lived BrowserContext so cookies and storage
+    never leak between articles.
+    """
+
+    def __init__(self) -> None:
+        self._loop = BackgroundLoop("playwright-pool")
+        self._start_lock = asyncio.Lock()
+        self._page_slots = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+
+    def run(self, coro: Coroutine[object, object, T]) -> T:
+        """Run a coroutine on the pool loop and block until it completes."""
+        return self._loop.run(coro)
+
+    def warm_start(self) -> None:
+        """Launch the browser in the background so the first fetch skips the cold start."""
+        future = self._loop.submit(self._get_browser())
+        future.add_done_callback(self._log_warm_start_failure)
+
+    def close(self) -> None:
+        if not self._loop.started:
+            return
+        try:
+            self._loop.run(self._shutdown(), timeout=10)
+        except Exception as exc:
+            logger.warning("Failed to shut down Playwright cleanly: %s", exc)
+
+    async def fetch(self, url: str, timeout: int = 40000) -> str:
+        async with self._page_slots:
+            context = await self._new_context()
+            try:
+                page = await context.new_page()
+                await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=SETTLE_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    pass
+                return await page.content()
+            finally:
+                await context.close()
+
+    async def fetch_many(
+        self, urls: List[str], concurrency: int = 10, timeout: int = 40000
+    ) -> List[Union[str, BaseException]]:
+        """
+        Fetch several pages with at most `concurrency` in flight.
+
+        Results keep the order of `urls`; a failed fetch yields its exception.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_one(url: str) -> str:
+            async with semaphore:
+                return await self.fetch(url, timeout=timeout)
+
+        return await asyncio.gather(*(fetch_one(url) for url in urls), return_exceptions=True)
+
+    async def _get_browser(self) -> Browser:
+        async with self._start_lock:
+            if self._browser is not None and not self._browser.is_connected():
+                logger.warning("Chromium disconnected, relaunching")
+                self._browser = None
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            if self._browser is None:
+                self._browser = await self._playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+                logger.info("Chromium launched for page fetching")
+
+            return self._browser
+
+    async def _new_context(self) -> BrowserContext:
+        browser = await self._get_browser()
+        context = await browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={"width": 1280, "height": 800},
+            java_script_enabled=True,
+        )
+
+        # Disable heavy resources (images, fonts, media, stylesheets)
+        async def block_heavy(route):
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", block_heavy)
+        return context
+
+    async def _shutdown(self) -> None:
+        async with self._start_lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    @staticmethod
+    def _log_warm_start_failure(future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            logger.warning("Playwright warm start failed: %s", exc)
+
+
+pool = PlaywrightPool()
+atexit.register(pool.close)
 
 
 class PlaywrightFetcher:
+    @staticmethod
+    def warm_start() -> None:
+        pool.warm_start()
+
     @staticmethod
     def fetch(url: str, timeout: int = 40000) -> str:
         """
-        Fetch the fully rendered HTML of a page using Playwright (sync version).
+        Fetch the fully rendered HTML of a page using the shared Playwright browser.
 
         Args:
             url (str): The URL to fetch.
@@ -16,35 +176,11 @@ class PlaywrightFetcher:
         Returns:
             str: HTML content of the page.
         """
-        with sync_playwright() as pw:
-            browser = pw.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/123.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1280, "height": 800},
-                java_script_enabled=True,
-            )
-
-            page = context.new_page()
-
-            # Disable heavy resources (images, fonts, media)
-            def block_heavy(route):
-                if route.request.resource_type in ["image", "font", "media"]:
-                    route.abort()
-                else:
-                    route.continue_()
-
-            context.route("**/*", block_heavy)
+        return pool.run(pool.fetch(url, timeout=timeout))
 
-            try:
-                page.goto(url, timeout=timeout, wait_until="domcontentloaded")
-            except Exception as e:
-                browser.close()
-                raise e
-            time.sleep(2)
-            html = page.content()
-            browser.close()
-            return html
+    @staticmethod
+    def fetch_many(
+        urls: List[str], concurrency: int = 10, timeout: int = 40000
+    ) -> List[Union[str, BaseException]]:
+        """Fetch several pages concurrently; see PlaywrightPool.fetch_many."""
+        return pool.run(pool.fetch_many(urls, concurrency=concurrency, timeout=timeout))
@@ -0,0 +1,34 @@
+"""Index only pending messages by send_at.
+
+Revision ID: 0004_partial_pending_send_at_index
+Revises: 0003_add_confirmation_message_id
+Create Date: 2026-10-16
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_partial_pending_send_at_index"
+down_revision = "0003_add_confirmation_message_id"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_scheduled_messages_status_send_at", table_name="scheduled_messages")
+    op.create_index(
+        "ix_scheduled_messages_pending_send_at",
+        "scheduled_messages",
+        ["send_at"],
+        postgresql_where=sa.text("status IN ('SCHEDULED', 'LOCKED')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scheduled_messages_pending_send_at", table_name="scheduled_messages")
+    op.create_index(
+        "ix_scheduled_messages_status_send_at",
+        "scheduled_messages",
+        ["status", "send_at"],
+    )
@@ -0,0 +1,40 @@
+"""Index confirmation_message_id only where it is set.
+
+Revision ID: 0005_partial_confirmation_message_id_index
+Revises: 0004_partial_pending_send_at_index
+Create Date: 2026-10-16
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_partial_confirmation_message_id_index"
+down_revision = "0004_partial_pending_send_at_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index(
+        "ix_scheduled_messages_confirmation_message_id",
+        table_name="scheduled_messages",
+    )
+    op.create_index(
+        "ix_scheduled_messages_confirmation_message_id",
+        "scheduled_messages",
+        ["confirmation_message_id"],
+        postgresql_where=sa.text("confirmation_message_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_scheduled_messages_confirmation_message_id",
+        table_name="scheduled_messages",
+    )
+    op.create_index(
+        "ix_scheduled_messages_confirmation_message_id",
+        "scheduled_messages",
+        ["confirmation_message_id"],
+    )
@@ -0,0 +1,68 @@
+"""Unique index on idempotency_key.
+
+Revision ID: 0006_unique_idempotency_key_index
+Revises: 0005_partial_confirmation_message_id_index
+Create Date: 2026-10-16
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_unique_idempotency_key_index"
+down_revision = "0005_partial_confirmation_message_id_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Older rows may share a key: the service only checked for an existing key
+    # before inserting. Keep the first row under each key and give the others
+    # a unique suffix, so no message is lost and the unique build can succeed.
+    op.execute(
+        """
+        UPDATE scheduled_messages AS m
+        SET idempotency_key = left(m.idempotency_key, 200) || ':dup:' || m.id::text
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY idempotency_key ORDER BY created_at, id
+            ) AS position
+            FROM scheduled_messages
+        ) AS ranked
+        WHERE m.id = ranked.id AND ranked.position > 1
+        """
+    )
+    # CONCURRENTLY can't run inside a transaction, but it keeps inserts flowing
+    # while the index builds.
+    with op.get_context().autocommit_block():
+        # A failed concurrent build leaves an INVALID index behind; drop it so
+        # the rerun builds a usable one instead of skipping the name.
+        invalid = op.get_bind().execute(
+            sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+            {"name": "ix_scheduled_messages_idempotency_key"},
+        ).scalar()
+        if invalid:
+            op.drop_index(
+                "ix_scheduled_messages_idempotency_key",
+                table_name="scheduled_messages",
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            "ix_scheduled_messages_idempotency_key",
+            "scheduled_messages",
+            ["idempotency_key"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        # Refresh planner statistics for the indexes added since 0003.
+        op.execute("ANALYZE scheduled_messages")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_scheduled_messages_idempotency_key",
+            table_name="scheduled_messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
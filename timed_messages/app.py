@@ -1,5 +1,7 @@
 import logging
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 
@@ -14,23 +16,12 @@ from .transport.whatsapp import create_router as create_whatsapp_router
 log_level = configure_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
-app.include_router(
-    create_whatsapp_router(
-        flow_store=InMemoryFlowStore(ttl=WhatsAppEventService._flow_ttl),
-    )
-)
-if os.getenv("TIMED_MESSAGES_ENABLE_DEBUG_API", "").lower() == "true":
-    app.include_router(scheduled_messages_router)
-
-
 TIMED_MESSAGES_INSTRUCTION = (
     "Timed Messages: use *add* to schedule, *list* to view pending messages, "
     "and cancel by replying *cancel* to a scheduled confirmation."
 )
 
 
-@app.on_event("startup")
 def log_admin_setup() -> None:
     runtime_config.set_instruction("timed_messages", TIMED_MESSAGES_INSTRUCTION)
     logger.info("Timed messages commands: !setup timed messages / !stop timed messages")
@@ -39,6 +30,22 @@ def log_admin_setup() -> None:
         logger.info("- %s", instruction)
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    log_admin_setup()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(
+    create_whatsapp_router(
+        flow_store=InMemoryFlowStore(ttl=WhatsAppEventService._flow_ttl),
+    )
+)
+if os.getenv("TIMED_MESSAGES_ENABLE_DEBUG_API", "").lower() == "true":
+    app.include_router(scheduled_messages_router)
+
+
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok"}
@@ -1,38 +1,40 @@
 from __future__ import annotations
 
-import re
-from urllib.parse import quote
+from urllib.parse import quote_from_bytes
+
+from shared.runtime_config import strip_non_digits
 
 from .models import ScheduledMessage
 
 
+DELIVERY_TEMPLATE = "⏰ Scheduled message ready\nTo: {to}\nText: {preview}\n{send}"
+SEND_UNAVAILABLE = "Send link unavailable for this recipient."
+PREVIEW_CHARS = 160
+WA_ME_PREFIX = "https://wa.me/"
+
+
 def format_assistant_delivery(msg: ScheduledMessage) -> str:
     link = build_whatsapp_link(msg.chat_id, msg.text)
-    to_display = display_chat_id(msg.chat_id)
-    preview = (msg.text or "").strip().replace("\n", " ")
-    if len(preview) > 160:
-        preview = f"{preview[:157]}..."
-    if link:
-        return (
-            "⏰ Scheduled message ready\n"
-            f"To: {to_display}\n"
-            f"Text: {preview}\n"
-            f"Send: {link}"
-        )
-    return (
-        "⏰ Scheduled message ready\n"
-        f"To: {to_display}\n"
-        f"Text: {preview}\n"
-        "Send link unavailable for this recipient."
+    # Only the head of the text can reach the preview; the extra room covers
+    # leading whitespace that strip() removes.
+    preview = (msg.text or "")[:PREVIEW_CHARS * 2].strip().replace("\n", " ")
+    if len(preview) > PREVIEW_CHARS:
+        preview = f"{preview[:PREVIEW_CHARS - 3]}..."
+    return DELIVERY_TEMPLATE.format(
+        to=display_chat_id(msg.chat_id),
+        preview=preview,
+        send=f"Send: {link}" if link else SEND_UNAVAILABLE,
     )
 
 
 def build_whatsapp_link(chat_id: str, text: str) -> str | None:
-    digits = re.sub(r"\D", "", chat_id or "")
+    if not chat_id:
+        return None
+    digits = strip_non_digits(chat_id)
     if not digits:
         return None
-    encoded = quote(text or "", safe="")
-    return f"https://wa.me/{digits}?text={encoded}"
+    encoded = quote_from_bytes(text.encode("utf-8"), safe=b"") if text else ""
+    return f"{WA_ME_PREFIX}{digits}?text={encoded}"
 
 
 def display_chat_id(value: str) -> str:
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import heapq
+import threading
+import time
+from datetime import timedelta
 from typing import Protocol
 
 
@@ -9,7 +12,7 @@ FlowState = dict[str, object]
 
 
 class FlowStore(Protocol):
-    def get(self, key: FlowKey, now: datetime) -> FlowState | None:
+    def get(self, key: FlowKey) -> FlowState | None:
         ...
 
     def set(self, key: FlowKey, value: FlowState) -> None:
@@ -20,22 +23,53 @@ class FlowStore(Protocol):
 
 
 class InMemoryFlowStore:
+    """
+    Flows that expire after `ttl` without activity.
+
+    Every get() is followed by a flow step, so it extends the flow's lifetime.
+    Expired flows are swept from a heap of deadlines on each call, so flows
+    that are never touched again do not pile up. Events are handled on the
+    threadpool, so every call holds the store lock.
+    """
+
     def __init__(self, ttl: timedelta) -> None:
-        self._ttl = ttl
-        self._flows: dict[FlowKey, FlowState] = {}
-
-    def get(self, key: FlowKey, now: datetime) -> FlowState | None:
-        flow = self._flows.get(key)
-        if not flow:
-            return None
-        updated_at = flow.get("updated_at")
-        if isinstance(updated_at, datetime) and now - updated_at > self._ttl:
-            self._flows.pop(key, None)
-            return None
-        return flow
+        self._ttl = ttl.total_seconds()
+        self._flows: dict[FlowKey, tuple[float, FlowState]] = {}
+        # (expires_at, key); entries superseded by a later deadline are skipped.
+        self._expiry_heap: list[tuple[float, FlowKey]] = []
+        self._lock = threading.Lock()
+
+    def get(self, key: FlowKey) -> FlowState | None:
+        with self._lock:
+            now = time.monotonic()
+            self._sweep(now)
+            entry = self._flows.get(key)
+            if entry is None:
+                return None
+            self._schedule(key, entry[1], now)
+            return entry[1]
 
     def set(self, key: FlowKey, value: FlowState) -> None:
-        self._flows[key] = value
+        with self._lock:
+            now = time.monotonic()
+            self._sweep(now)
+            self._schedule(key, value, now)
 
     def clear(self, key: FlowKey) -> None:
-        self._flows.pop(key, None)
+        with self._lock:
+            self._flows.pop(key, None)
+
+    def _schedule(self, key: FlowKey, value: FlowState, now: float) -> None:
+        # Caller must hold self._lock.
+        expires_at = now + self._ttl
+        self._flows[key] = (expires_at, value)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+    def _sweep(self, now: float) -> None:
+        # Caller must hold self._lock.
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._flows.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._flows[key]
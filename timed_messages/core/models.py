@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import BigInteger, DateTime, Enum as SAEnum, Index, String, Text, func
+from sqlalchemy import BigInteger, DateTime, Enum as SAEnum, Index, String, Text, func, text as sa_text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -8,7 +8,7 @@ from timed_messages.db import Base
 from datetime import datetime
 from enum import Enum
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class MessageStatus(str, Enum):
@@ -20,6 +20,10 @@ class MessageStatus(str, Enum):
 
 
 class ScheduledMessage(BaseModel):
+    # Validates straight from DB rows or ORM records; instances are never mutated
+    # in place, so they are safe to share.
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: UUID
     chat_id: str
     from_chat_id: str | None = None
@@ -71,7 +75,16 @@ class ScheduledMessageRecord(Base):
     )
 
     __table_args__ = (
-        Index("ix_scheduled_messages_status_send_at", "status", "send_at"),
+        Index(
+            "ix_scheduled_messages_pending_send_at",
+            "send_at",
+            postgresql_where=sa_text("status IN ('SCHEDULED', 'LOCKED')"),
+        ),
         Index("ix_scheduled_messages_send_at", "send_at"),
-        Index("ix_scheduled_messages_confirmation_message_id", "confirmation_message_id"),
+        Index("ix_scheduled_messages_idempotency_key", "idempotency_key", unique=True),
+        Index(
+            "ix_scheduled_messages_confirmation_message_id",
+            "confirmation_message_id",
+            postgresql_where=sa_text("confirmation_message_id IS NOT NULL"),
+        ),
     )
@@ -10,6 +10,9 @@ class ScheduledMessageRepository(ABC):
     @abstractmethod
     def create(self, msg: ScheduledMessage) -> None: ...
 
+    @abstractmethod
+    def create_many(self, msgs: list[ScheduledMessage]) -> list[ScheduledMessage]: ...
+
     @abstractmethod
     def get_by_id(self, msg_id: UUID) -> ScheduledMessage | None: ...
 
@@ -20,7 +23,10 @@ class ScheduledMessageRepository(ABC):
     def list_scheduled(self, limit: int) -> list[ScheduledMessage]: ...
 
     @abstractmethod
-    def lock_for_sending(self, msg_id: UUID, now: datetime) -> bool: ...
+    def lock_for_sending(self, msg_id: UUID, now: datetime) -> ScheduledMessage | None: ...
+
+    @abstractmethod
+    def claim_due_batch(self, now: datetime, limit: int) -> list[ScheduledMessage]: ...
 
     @abstractmethod
     def mark_sent(self, msg_id: UUID, sent_at: datetime) -> None: ...
@@ -2,23 +2,34 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timezone, timedelta
-import re
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 from uuid import uuid4, UUID
 
 from .assistant_delivery import format_assistant_delivery
 from .models import ScheduledMessage, MessageStatus
 from .repository import ScheduledMessageRepository
-from shared.runtime_config import assistant_mode_enabled
+from shared.runtime_config import assistant_mode_enabled, normalize_sender_id
 
 if TYPE_CHECKING:
     from ..transport.whatsapp import WhatsAppTransport
 
 
+def _assistant_schedule_window() -> timedelta:
+    value = os.getenv("WHATSAPP_ASSISTANT_MAX_SCHEDULE_HOURS", "24").strip()
+    try:
+        hours = int(value)
+    except ValueError:
+        hours = 24
+    if hours <= 0:
+        hours = 24
+    return timedelta(hours=hours)
+
+
 class TimedMessageService:
     def __init__(self, repo: ScheduledMessageRepository, clock=None):
         self.repo = repo
         self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self._max_window = _assistant_schedule_window()
 
     # ---------- Public API ----------
 
@@ -32,43 +43,74 @@ class TimedMessageService:
         idempotency_key: str,
         source: str,
         reason: str | None = None,
+        now: datetime | None = None,
     ) -> ScheduledMessage:
-        now = self.clock()
-
-        if send_at.tzinfo is None:
-            raise ValueError("send_at must be timezone-aware (UTC)")
-
-        if send_at <= now:
-            raise ValueError("send_at must be in the future")
-
-        if assistant_mode_enabled() and not from_chat_id:
-            raise ValueError("from_chat_id required in assistant mode")
-
-        # Idempotency check
-        existing = self.repo.find_by_idempotency_key(idempotency_key)
-        if existing:
-            return existing
-
-        msg = ScheduledMessage(
-            id=uuid4(),
-            chat_id=chat_id,
-            from_chat_id=from_chat_id,
-            text=text,
-            send_at=send_at,
-            status=MessageStatus.SCHEDULED,
-            locked_at=None,
-            sent_at=None,
-            attempt_count=0,
-            last_error=None,
-            idempotency_key=idempotency_key,
-            source=source,
-            reason=reason,
-            created_at=now,
-            updated_at=now,
-        )
+        return self.schedule_messages([
+            {
+                "chat_id": chat_id,
+                "from_chat_id": from_chat_id,
+                "text": text,
+                "send_at": send_at,
+                "idempotency_key": idempotency_key,
+                "source": source,
+                "reason": reason,
+            }
+        ], now=now)[0]
+
+    def schedule_messages(
+        self,
+        specs: list[dict[str, Any]],
+        *,
+        now: datetime | None = None,
+    ) -> list[ScheduledMessage]:
+        """
+        Schedule several messages with one insert.
 
-        self.repo.create(msg)
-        return msg
+        Each spec takes schedule_message()'s keyword arguments. Results follow
+        the order of `specs`; a repeated idempotency key, in the batch or
+        already stored, yields the message stored first.
+        """
+        now = now or self.clock()
+        assistant_mode = assistant_mode_enabled()
+        pending: dict[str, ScheduledMessage] = {}
+        for spec in specs:
+            send_at = spec["send_at"]
+            if send_at.tzinfo is None:
+                raise ValueError("send_at must be timezone-aware (UTC)")
+
+            if send_at <= now:
+                raise ValueError("send_at must be in the future")
+
+            if assistant_mode and not spec.get("from_chat_id"):
+                raise ValueError("from_chat_id required in assistant mode")
+
+            idempotency_key = spec["idempotency_key"]
+            if idempotency_key in pending:
+                continue
+            pending[idempotency_key] = ScheduledMessage(
+                id=uuid4(),
+                chat_id=spec["chat_id"],
+                from_chat_id=spec.get("from_chat_id"),
+                text=spec["text"],
+                send_at=send_at,
+                status=MessageStatus.SCHEDULED,
+                locked_at=None,
+                sent_at=None,
+                attempt_count=0,
+                last_error=None,
+                idempotency_key=idempotency_key,
+                source=spec["source"],
+                reason=spec.get("reason"),
+                created_at=now,
+                updated_at=now,
+            )
+
+        # Insert and idempotency check in one step.
+        stored = {
+            msg.idempotency_key: msg
+            for msg in self.repo.create_many(list(pending.values()))
+        }
+        return [stored[spec["idempotency_key"]] for spec in specs]
 
     def validate_assistant_schedule_window(
         self,
@@ -80,7 +122,7 @@ class TimedMessageService:
             return
 
         current = now or self.clock()
-        max_window = self._assistant_schedule_window()
+        max_window = self._max_window
         if send_at - current <= max_window:
             return
 
@@ -91,16 +133,6 @@ class TimedMessageService:
             "Long-range scheduling uses paid Meta messaging, and I'm working for free :/"
         )
 
-    def _assistant_schedule_window(self) -> timedelta:
-        value = os.getenv("WHATSAPP_ASSISTANT_MAX_SCHEDULE_HOURS", "24").strip()
-        try:
-            hours = int(value)
-        except ValueError:
-            hours = 24
-        if hours <= 0:
-            hours = 24
-        return timedelta(hours=hours)
-
     def cancel_message(self, msg_id: UUID) -> None:
         msg = self.repo.get_by_id(msg_id)
         if not msg:
@@ -127,10 +159,25 @@ class TimedMessageService:
 
     # ---------- Worker-facing API ----------
 
-    def list_due_messages(self, limit: int = 10) -> list[ScheduledMessage]:
-        now = self.clock()
+    def list_due_messages(
+        self,
+        limit: int = 10,
+        *,
+        now: datetime | None = None,
+    ) -> list[ScheduledMessage]:
+        now = now or self.clock()
         return self.repo.list_upcoming(now=now, limit=limit)
 
+    def claim_due_messages(
+        self,
+        limit: int = 10,
+        *,
+        now: datetime | None = None,
+    ) -> list[ScheduledMessage]:
+        """Lock up to `limit` due messages for this worker; pass each to send_locked_message."""
+        now = now or self.clock()
+        return self.repo.claim_due_batch(now=now, limit=limit)
+
     def list_scheduled_messages(self, limit: int = 10) -> list[ScheduledMessage]:
         return self.repo.list_scheduled(limit=limit)
 
@@ -197,31 +244,30 @@ class TimedMessageService:
         msg_id: UUID,
         transport: WhatsAppTransport,
         quoted_message_id: Optional[UUID],
+        *,
+        now: datetime | None = None,
     ) -> None:
         """
         send_func(chat_id: str, text: str, message_id: UUID) -> None
         """
-        now = self.clock()
-        msg = self.repo.get_by_id(msg_id)
-
-        if not msg:
-            return
-
-        if msg.status in {
-            MessageStatus.CANCELLED,
-            MessageStatus.SENT,
-            MessageStatus.FAILED,
-        }:
-            return
-
-        if msg.send_at > now:
-            return
-
-        # Atomic lock
-        locked = self.repo.lock_for_sending(msg_id, now)
-        if not locked:
+        now = now or self.clock()
+        # One atomic statement: only a due, unlocked message comes back, and
+        # only to the caller that locked it.
+        msg = self.repo.lock_for_sending(msg_id, now)
+        if msg is None:
             return
+        self.send_locked_message(msg, transport, quoted_message_id, now=now)
 
+    def send_locked_message(
+        self,
+        msg: ScheduledMessage,
+        transport: WhatsAppTransport,
+        quoted_message_id: Optional[UUID],
+        *,
+        now: datetime | None = None,
+    ) -> None:
+        """Send a message this worker has already locked and record the outcome."""
+        now = now or self.clock()
         try:
             if assistant_mode_enabled():
                 if not msg.from_chat_id:
@@ -240,12 +286,11 @@ class TimedMessageService:
                     message_id=msg.id,
                     quoted_message_id=quoted_message_id
                 )
-            self.repo.mark_sent(msg_id, sent_at=now)
+            self.repo.mark_sent(msg.id, sent_at=now)
 
         except Exception as e:
-            self.repo.mark_failed(msg_id, error=str(e))
+            self.repo.mark_failed(msg.id, error=str(e))
             raise
 
     def _normalize_sender_id(self, sender_id: str) -> str:
-        digits = re.sub(r"\D", "", sender_id or "")
-        return digits if digits else (sender_id or "").strip()
+        return normalize_sender_id(sender_id)
@@ -58,7 +58,6 @@ class WhatsAppEventService:
         quoted_message_id: Optional[str],
         contact_name: Optional[str],
         contact_phone: Optional[str | list[str]],
-        timestamp: datetime,
         is_group: bool,
         raw: Optional[dict],
     ) -> tuple[bool, Optional[str]]:
@@ -95,7 +94,7 @@ class WhatsAppEventService:
             if not allowed_group or chat_id != allowed_group:
                 return False, "unauthorized_group"
 
-        flow = self._get_active_flow(chat_id, sender_id, timestamp)
+        flow = self._get_active_flow(chat_id, sender_id)
         if flow:
             return self._handle_flow_step(
                 flow=flow,
@@ -104,14 +103,13 @@ class WhatsAppEventService:
                 text=text,
                 contact_name=contact_name,
                 contact_phone=contact_phone,
-                timestamp=timestamp,
             )
 
         if not text:
             return False, "no_text"
 
         if command == "add":
-            self._start_flow(chat_id, sender_id, message_id, timestamp)
+            self._start_flow(chat_id, sender_id, message_id)
             self._send_reply(
                 chat_id,
                 "*To Who?*\n(Phone number or contact)",
@@ -162,10 +160,9 @@ class WhatsAppEventService:
         self,
         chat_id: str,
         sender_id: str,
-        timestamp: datetime,
     ) -> Optional[dict[str, object]]:
         key = (chat_id, sender_id)
-        flow = self.flow_store.get(key, timestamp)
+        flow = self.flow_store.get(key)
         if not flow:
             return None
         return flow
@@ -208,13 +205,11 @@ class WhatsAppEventService:
         chat_id: str,
         sender_id: str,
         message_id: str,
-        timestamp: datetime,
     ) -> None:
         self.flow_store.set((chat_id, sender_id), {
             "step": "to",
             "request_id": message_id,
             "sender_id": sender_id,
-            "updated_at": timestamp,
         })
 
     def _handle_flow_step(
@@ -226,10 +221,8 @@ class WhatsAppEventService:
         text: str,
         contact_name: Optional[str],
         contact_phone: Optional[str | list[str]],
-        timestamp: datetime,
     ) -> tuple[bool, Optional[str]]:
         step = flow.get("step")
-        flow["updated_at"] = timestamp
         if text.strip().lower() == "cancel":
             self.flow_store.clear((chat_id, str(flow.get("sender_id"))))
             self._send_reply(chat_id, "✅ Canceled scheduling.", message_id)
@@ -3,6 +3,10 @@ from __future__ import annotations
 import re
 from typing import Optional
 
+from shared.runtime_config import strip_non_digits
+
+_ID_PREFIX_RE = re.compile(r"\b([0-9a-fA-F]{12})\b")
+
 
 def normalize_recipient(
     value: str,
@@ -13,12 +17,12 @@ def normalize_recipient(
         return value
 
     if value:
-        digits = re.sub(r"\D", "", value)
+        digits = strip_non_digits(value)
         if len(digits) >= 8:
             return f"{digits}@s.whatsapp.net"
 
     if contact_phone:
-        digits = re.sub(r"\D", "", contact_phone)
+        digits = strip_non_digits(contact_phone)
         if len(digits) >= 8:
             return f"{digits}@s.whatsapp.net"
 
@@ -31,7 +35,7 @@ def normalize_contact_phone(
     if isinstance(contact_phone, list):
         normalized = []
         for value in contact_phone:
-            digits = re.sub(r"\D", "", str(value or ""))
+            digits = strip_non_digits(str(value or ""))
             if len(digits) >= 8 and digits not in normalized:
                 normalized.append(digits)
         if len(normalized) > 1:
@@ -42,7 +46,7 @@ def normalize_contact_phone(
 
     if not contact_phone:
         return None, None
-    digits = re.sub(r"\D", "", str(contact_phone))
+    digits = strip_non_digits(str(contact_phone))
     if len(digits) >= 8:
         return digits, None
     return None, None
@@ -51,5 +55,5 @@ def normalize_contact_phone(
 def extract_id_prefix(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
-    match = re.search(r"\b([0-9a-fA-F]{12})\b", text)
+    match = _ID_PREFIX_RE.search(text)
     return match.group(1) if match else None
@@ -4,6 +4,8 @@ from datetime import datetime, timedelta
 import re
 from zoneinfo import ZoneInfo
 
+_CLOCK_TIME_RE = re.compile(r"\d{1,2}:\d{2}")
+
 
 def load_timezone(tz_name: str | None) -> ZoneInfo:
     if not tz_name:
@@ -20,7 +22,7 @@ def parse_datetime(value: str, tz_name: str | None, now_utc: datetime) -> dateti
     tz = load_timezone(tz_name)
     now = now_utc.astimezone(tz)
 
-    if re.fullmatch(r"\d{1,2}:\d{2}", value):
+    if _CLOCK_TIME_RE.fullmatch(value):
         try:
             time_part = datetime.strptime(value, "%H:%M").time()
         except ValueError as exc:
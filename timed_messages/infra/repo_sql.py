@@ -9,17 +9,21 @@ from ..core.repository import ScheduledMessageRepository
 from .repo_sql_mapper import row_to_scheduled_message
 from .repo_sql_queries import (
     CANCEL_SQL,
+    CLAIM_DUE_BATCH_SQL,
     FIND_BY_CONFIRMATION_FOR_SENDER_SQL,
     FIND_BY_ID_PREFIX_FOR_SENDER_SQL,
     FIND_BY_ID_PREFIX_SQL,
     FIND_DUE_SQL,
     FIND_SCHEDULED_SQL,
+    GET_BY_IDEMPOTENCY_KEYS_SQL,
     GET_BY_IDEMPOTENCY_SQL,
     GET_BY_ID_SQL,
     INSERT_MESSAGE_SQL,
+    INSERT_MESSAGES_SQL,
     LIST_SCHEDULED_FOR_SENDER_SQL,
     LOCK_FOR_SENDING_SQL,
     MARK_FAILED_SQL,
+    MESSAGE_VALUES_TEMPLATE,
     MARK_SENT_SQL,
     SET_CONFIRMATION_MESSAGE_ID_SQL,
     UPDATE_METADATA_SQL,
@@ -42,6 +46,28 @@ class PostgresScheduledMessageRepository(ScheduledMessageRepository):
                 msg.model_dump(),
             )
 
+    def create_many(self, msgs: list[ScheduledMessage]) -> list[ScheduledMessage]:
+        if not msgs:
+            return []
+        with self.conn, self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            rows = psycopg2.extras.execute_values(
+                cur,
+                INSERT_MESSAGES_SQL,
+                [msg.model_dump() for msg in msgs],
+                template=MESSAGE_VALUES_TEMPLATE,
+                page_size=len(msgs),
+                fetch=True,
+            )
+            if len(rows) < len(msgs):
+                # Keys that were already stored come back as their existing rows.
+                inserted = {row["idempotency_key"] for row in rows}
+                cur.execute(
+                    GET_BY_IDEMPOTENCY_KEYS_SQL,
+                    ([msg.idempotency_key for msg in msgs if msg.idempotency_key not in inserted],),
+                )
+                rows.extend(cur.fetchall())
+        return [row_to_scheduled_message(row) for row in rows]
+
     def get(self, msg_id: UUID) -> ScheduledMessage | None:
         with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
             cur.execute(
@@ -88,7 +114,7 @@ class PostgresScheduledMessageRepository(ScheduledMessageRepository):
         with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
             cur.execute(
                 FIND_DUE_SQL,
-                (now, now, stale_before, limit),
+                (now, stale_before, limit),
             )
             rows = cur.fetchall()
             return [row_to_scheduled_message(r) for r in rows]
@@ -140,18 +166,31 @@ class PostgresScheduledMessageRepository(ScheduledMessageRepository):
             row = cur.fetchone()
             return row_to_scheduled_message(row) if row else None
 
-    def lock(self, msg_id: UUID, now: datetime) -> bool:
-        with self.conn, self.conn.cursor() as cur:
+    def lock(self, msg_id: UUID, now: datetime) -> ScheduledMessage | None:
+        with self.conn, self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
             cur.execute(
                 LOCK_FOR_SENDING_SQL,
                 (
                     now,
                     now,
                     msg_id,
+                    now,
                     now - timedelta(seconds=LOCK_TIMEOUT_SECONDS),
                 ),
             )
-            return cur.rowcount == 1
+            row = cur.fetchone()
+            return row_to_scheduled_message(row) if row else None
+
+    def claim_due_batch(self, now: datetime, limit: int) -> list[ScheduledMessage]:
+        stale_before = now - timedelta(seconds=LOCK_TIMEOUT_SECONDS)
+        with self.conn, self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.execute(
+                CLAIM_DUE_BATCH_SQL,
+                (now, now, now, stale_before, limit),
+            )
+            rows = cur.fetchall()
+        # RETURNING does not keep the subquery's order.
+        return sorted((row_to_scheduled_message(r) for r in rows), key=lambda msg: msg.send_at)
 
     def mark_sent(self, msg_id: UUID, sent_at: datetime) -> None:
         with self.conn, self.conn.cursor() as cur:
@@ -185,7 +224,7 @@ class PostgresScheduledMessageRepository(ScheduledMessageRepository):
     def list_scheduled(self, limit: int) -> list[ScheduledMessage]:
         return self.find_scheduled(limit)
 
-    def lock_for_sending(self, msg_id: UUID, now: datetime) -> bool:
+    def lock_for_sending(self, msg_id: UUID, now: datetime) -> ScheduledMessage | None:
         return self.lock(msg_id, now)
 
     def update_metadata(self, msg_id: UUID, message: ScheduledMessage) -> None:
@@ -13,8 +13,30 @@ VALUES (
 )
 """
 
+# For psycopg2.extras.execute_values: VALUES %s expands to one MESSAGE_VALUES_TEMPLATE per row.
+# ON CONFLICT relies on the unique ix_scheduled_messages_idempotency_key index.
+INSERT_MESSAGES_SQL = """
+INSERT INTO scheduled_messages (
+    id, chat_id, from_chat_id, confirmation_message_id, text, send_at, status,
+    locked_at, sent_at, attempt_count, last_error,
+    idempotency_key, source, reason,
+    created_at, updated_at
+)
+VALUES %s
+ON CONFLICT (idempotency_key) DO NOTHING
+RETURNING *
+"""
+
+MESSAGE_VALUES_TEMPLATE = """(
+    %(id)s, %(chat_id)s, %(from_chat_id)s, %(confirmation_message_id)s, %(text)s, %(send_at)s, %(status)s,
+    %(locked_at)s, %(sent_at)s, %(attempt_count)s, %(last_error)s,
+    %(idempotency_key)s, %(source)s, %(reason)s,
+    %(created_at)s, %(updated_at)s
+)"""
+
 GET_BY_ID_SQL = "SELECT * FROM scheduled_messages WHERE id = %s"
 GET_BY_IDEMPOTENCY_SQL = "SELECT * FROM scheduled_messages WHERE idempotency_key = %s"
+GET_BY_IDEMPOTENCY_KEYS_SQL = "SELECT * FROM scheduled_messages WHERE idempotency_key = ANY(%s)"
 
 FIND_BY_ID_PREFIX_SQL = """
 SELECT *
@@ -34,17 +56,18 @@ ORDER BY created_at DESC
 LIMIT %s
 """
 
+# The status IN (...) predicate matches ix_scheduled_messages_pending_send_at.
 FIND_DUE_SQL = """
 SELECT *
 FROM scheduled_messages
-WHERE (
-    status = 'SCHEDULED'
-    AND send_at <= %s
-) OR (
-    status = 'LOCKED'
+WHERE
+    status IN ('SCHEDULED', 'LOCKED')
     AND send_at <= %s
-    AND (locked_at IS NULL OR locked_at < %s)
-)
+    AND (
+        status = 'SCHEDULED'
+        OR locked_at IS NULL
+        OR locked_at < %s
+    )
 ORDER BY send_at
 LIMIT %s
 """
@@ -94,6 +117,7 @@ SET
     updated_at = %s
 WHERE
     id = %s
+    AND send_at <= %s
     AND (
         status = 'SCHEDULED'
         OR (
@@ -101,6 +125,33 @@ WHERE
             AND (locked_at IS NULL OR locked_at < %s)
         )
     )
+RETURNING *
+"""
+
+# Locks up to LIMIT due messages in one statement; rows another worker is
+# claiming right now are skipped rather than waited on.
+CLAIM_DUE_BATCH_SQL = """
+UPDATE scheduled_messages
+SET
+    status = 'LOCKED',
+    locked_at = %s,
+    updated_at = %s
+WHERE id IN (
+    SELECT id
+    FROM scheduled_messages
+    WHERE
+        status IN ('SCHEDULED', 'LOCKED')
+        AND send_at <= %s
+        AND (
+            status = 'SCHEDULED'
+            OR locked_at IS NULL
+            OR locked_at < %s
+        )
+    ORDER BY send_at
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING *
 """
 
 MARK_SENT_SQL = """
@@ -1,7 +1,8 @@
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
-from shared.runtime_config import CommonRuntimeConfig, JsonFileConfig
+from shared.auth import generate_six_digit_code
+from shared.runtime_config import CommonRuntimeConfig, JsonFileConfig, common_runtime_config
 
 
 DEFAULT_TIMED_MESSAGES_CONFIG_PATH = os.getenv(
@@ -15,7 +16,7 @@ class TimedMessagesRuntimeConfig(JsonFileConfig):
         path: str = DEFAULT_TIMED_MESSAGES_CONFIG_PATH,
         common: CommonRuntimeConfig | None = None,
     ) -> None:
-        self._common = common or CommonRuntimeConfig()
+        self._common = common or common_runtime_config()
         super().__init__(path, debug_label="timed_messages_config")
 
     def admin_sender_id(self) -> str:
@@ -28,10 +29,10 @@ class TimedMessagesRuntimeConfig(JsonFileConfig):
             return code
         code = self._generate_setup_code()
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             data["admin_setup_code"] = code
             self._write_to_disk(data)
-        self._data = data
+            self._set_data(data)
         return code
 
     def approved_numbers(self) -> list[str]:
@@ -49,7 +50,7 @@ class TimedMessagesRuntimeConfig(JsonFileConfig):
     def is_sender_approved(self, sender_id: str) -> bool:
         return self._common.is_sender_approved(sender_id)
 
-    def instructions(self) -> dict[str, str]:
+    def instructions(self) -> Mapping[str, str]:
         return self._common.instructions()
 
     def set_instruction(self, service_name: str, instruction: str) -> None:
@@ -61,28 +62,28 @@ class TimedMessagesRuntimeConfig(JsonFileConfig):
 
     def set_scheduling_group(self, group_id: str) -> None:
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             data["group_id"] = group_id
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def clear_scheduling_group(self) -> None:
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             data["group_id"] = ""
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def set_admin_sender_id(self, sender_id: str) -> None:
         self._common.set_admin_sender_id(sender_id)
         with self._lock:
-            data = self._load_from_disk()
+            data = self._load_for_update()
             data["admin_setup_code"] = ""
             self._write_to_disk(data)
-            self._data = data
+            self._set_data(data)
 
     def _generate_setup_code(self) -> str:
-        return f"{int.from_bytes(os.urandom(3), 'big') % 1_000_000:06d}"
+        return generate_six_digit_code()
 
     def _default_data(self) -> Dict[str, Any]:
         return {"group_id": "", "admin_setup_code": ""}
@@ -7,6 +7,7 @@ from uuid import UUID
 
 import pytest
 
+from shared.runtime_config import reset_config_cache
 from timed_messages.core.models import MessageStatus, ScheduledMessage
 
 
@@ -17,6 +18,16 @@ class FakeRepo:
     def create(self, msg: ScheduledMessage) -> None:
         self.messages[msg.id] = msg
 
+    def create_many(self, msgs: list[ScheduledMessage]) -> list[ScheduledMessage]:
+        stored = []
+        for msg in msgs:
+            existing = self.find_by_idempotency_key(msg.idempotency_key)
+            if existing is None:
+                self.create(msg)
+                existing = msg
+            stored.append(existing)
+        return stored
+
     def get_by_id(self, msg_id: UUID) -> ScheduledMessage | None:
         return self.messages.get(msg_id)
 
@@ -33,14 +44,21 @@ class FakeRepo:
             if msg.status == MessageStatus.SCHEDULED
         ][:limit]
 
-    def lock_for_sending(self, msg_id: UUID, now: datetime) -> bool:
+    def lock_for_sending(self, msg_id: UUID, now: datetime) -> ScheduledMessage | None:
         msg = self.messages.get(msg_id)
-        if not msg or msg.status != MessageStatus.SCHEDULED:
-            return False
-        self.messages[msg_id] = msg.model_copy(
-            update={"status": MessageStatus.LOCKED, "locked_at": now}
-        )
-        return True
+        if not msg or msg.status != MessageStatus.SCHEDULED or msg.send_at > now:
+            return None
+        locked = msg.model_copy(update={"status": MessageStatus.LOCKED, "locked_at": now})
+        self.messages[msg_id] = locked
+        return locked
+
+    def claim_due_batch(self, now: datetime, limit: int) -> list[ScheduledMessage]:
+        claimed = []
+        for msg in self.list_upcoming(now, limit):
+            locked = self.lock_for_sending(msg.id, now)
+            if locked is not None:
+                claimed.append(locked)
+        return claimed
 
     def mark_sent(self, msg_id: UUID, sent_at: datetime) -> None:
         msg = self.messages[msg_id]
@@ -154,6 +172,13 @@ class FakeTransport:
         return "confirmation-id"
 
 
+@pytest.fixture(autouse=True)
+def fresh_config_cache():
+    reset_config_cache()
+    yield
+    reset_config_cache()
+
+
 @pytest.fixture
 def fixed_now() -> datetime:
     return datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
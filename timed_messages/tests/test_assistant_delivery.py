@@ -39,3 +39,11 @@ def test_format_assistant_delivery_with_link():
 def test_format_assistant_delivery_without_link():
     text = format_assistant_delivery(_msg("group:abc", "hello"))
     assert "Send link unavailable" in text
+
+
+def test_format_assistant_delivery_truncates_long_preview():
+    text = format_assistant_delivery(_msg("group:abc", "  line one\n" + "x" * 5000))
+    preview = text.split("Text: ", 1)[1].split("\n", 1)[0]
+    assert preview.startswith("line one x")
+    assert len(preview) == 160
+    assert preview.endswith("...")
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
 from shared.auth import InMemoryPendingAuthStore, SixDigitAuthCodeGenerator
+from shared.auth_service import AuthMicroservice
 
 
 def test_auth_code_generator_format():
@@ -28,3 +29,58 @@ def test_pending_auth_store_clear():
     store.set("15550001111", "123456", now)
     store.clear("15550001111")
     assert store.get("15550001111", now + timedelta(minutes=1)) is None
+
+
+def test_pending_auth_store_evicts_other_expired_entries():
+    store = InMemoryPendingAuthStore(ttl=timedelta(minutes=30))
+    now = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    store.set("15550001111", "123456", now)
+    store.set("15550002222", "654321", now + timedelta(minutes=20))
+
+    store.set("15550003333", "111111", now + timedelta(minutes=31))
+
+    assert "15550001111" not in store._entries
+    assert store.get("15550002222", now + timedelta(minutes=31)).code == "654321"
+
+
+def test_pending_auth_store_overwrite_keeps_latest_expiry():
+    store = InMemoryPendingAuthStore(ttl=timedelta(minutes=30))
+    now = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    store.set("15550001111", "123456", now)
+    store.set("15550001111", "654321", now + timedelta(minutes=20))
+
+    entry = store.get("15550001111", now + timedelta(minutes=31))
+    assert entry is not None
+    assert entry.code == "654321"
+
+
+def test_instructions_message_rebuilt_only_when_mapping_is_replaced():
+    state = {"instructions": {"timed": "Schedule a message"}}
+
+    def unused(*args, **kwargs):
+        return None
+
+    service = AuthMicroservice(
+        send_reply=unused,
+        admin_sender_id=lambda: "",
+        set_admin_sender_id=unused,
+        admin_setup_code=lambda: "",
+        is_sender_approved=lambda sender_id: True,
+        normalize_sender_id=lambda sender_id: sender_id,
+        add_approved_number=unused,
+        generate_auth_code=lambda: "123456",
+        get_pending_auth=unused,
+        set_pending_auth=unused,
+        clear_pending_auth=unused,
+        instructions=lambda: state["instructions"],
+        now=lambda: datetime(2024, 1, 1, tzinfo=timezone.utc),
+        extract_requester_identity=unused,
+        format_admin_auth_request=unused,
+    )
+
+    first = service.build_instructions_message(include_welcome=False)
+    assert "- Schedule a message" in first
+    assert service.build_instructions_message(include_welcome=False) is first
+
+    state["instructions"] = {"timed": "Schedule a message", "summarizer": "Send a link"}
+    assert "- Send a link" in service.build_instructions_message(include_welcome=False)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from timed_messages.core import flow_store as flow_store_module
+from timed_messages.core.flow_store import InMemoryFlowStore
+
+
+def test_flows_expire_after_ttl_without_activity(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(flow_store_module.time, "monotonic", lambda: clock[0])
+    store = InMemoryFlowStore(ttl=timedelta(seconds=60))
+
+    store.set(("chat-1", "sender-1"), {"step": "to"})
+    store.set(("chat-2", "sender-2"), {"step": "to"})
+
+    clock[0] = 150.0
+    assert store.get(("chat-1", "sender-1")) == {"step": "to"}
+
+    # chat-1 was extended by the get above; chat-2 was never touched again.
+    clock[0] = 200.0
+    assert store.get(("chat-1", "sender-1")) == {"step": "to"}
+    assert ("chat-2", "sender-2") not in store._flows
+
+    clock[0] = 261.0
+    assert store.get(("chat-1", "sender-1")) is None
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+
+from shared.runtime_config import CommonRuntimeConfig
+
+
+def _config(tmp_path, data=None):
+    path = tmp_path / "common_runtime.json"
+    if data is not None:
+        path.write_text(json.dumps(data), encoding="utf-8")
+    return CommonRuntimeConfig(str(path))
+
+
+def test_approved_set_includes_admin_and_tracks_writes(tmp_path):
+    config = _config(
+        tmp_path,
+        {"admin_sender_id": "15550000000@s.whatsapp.net", "approved_numbers": ["+1 555 111 2222"]},
+    )
+
+    assert config.is_sender_approved("15551112222@s.whatsapp.net")
+    assert config.is_sender_approved("15550000000")
+    assert not config.is_sender_approved("15553334444")
+
+    config.add_approved_number("15553334444")
+    assert config.is_sender_approved("15553334444")
+
+    config.remove_approved_number("+1 (555) 111-2222")
+    assert not config.is_sender_approved("15551112222")
+
+
+def test_write_is_atomic_and_skipped_when_unchanged(tmp_path):
+    config = _config(tmp_path)
+    path = tmp_path / "common_runtime.json"
+
+    config.set_admin_sender_id("15550000000")
+    first_mtime = path.stat().st_mtime_ns
+    assert json.loads(path.read_text(encoding="utf-8"))["admin_sender_id"] == "15550000000"
+    assert not (tmp_path / "common_runtime.json.tmp").exists()
+
+    config.set_admin_sender_id("15550000000")
+    assert path.stat().st_mtime_ns == first_mtime
+
+
+def test_mutations_build_on_each_other(tmp_path):
+    config = _config(tmp_path)
+    path = tmp_path / "common_runtime.json"
+
+    config.add_approved_number("15551112222")
+    config.add_approved_number("15553334444")
+
+    assert json.loads(path.read_text(encoding="utf-8"))["approved_numbers"] == ["15551112222", "15553334444"]
+
+
+def test_mutation_builds_on_another_instances_write(tmp_path, monkeypatch):
+    monkeypatch.setattr("shared.runtime_config.CHECK_INTERVAL", 3600.0)
+    path = tmp_path / "common_runtime.json"
+    first = CommonRuntimeConfig(str(path))
+    second = CommonRuntimeConfig(str(path))
+
+    first.add_approved_number("15551112222")
+    second.add_approved_number("15553334444")
+
+    assert json.loads(path.read_text(encoding="utf-8"))["approved_numbers"] == ["15551112222", "15553334444"]
+
+
+def test_failed_write_raises_and_keeps_memory_in_step_with_disk(tmp_path, monkeypatch):
+    config = _config(tmp_path, {"approved_numbers": ["15551112222"]})
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("shared.runtime_config.os.replace", fail_replace)
+    with pytest.raises(OSError):
+        config.add_approved_number("15553334444")
+
+    assert config.approved_numbers() == ["15551112222"]
+
+
+def test_refresh_skips_reparse_when_bytes_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr("shared.runtime_config.CHECK_INTERVAL", 0.0)
+    config = _config(tmp_path, {"approved_numbers": ["15551112222"]})
+    path = tmp_path / "common_runtime.json"
+    data = config._data
+
+    os.utime(path, ns=(0, 0))
+    config.approved_numbers()
+    assert config._data is data
+
+    path.write_text(json.dumps({"approved_numbers": ["15553334444"]}), encoding="utf-8")
+    assert config.approved_numbers() == ["15553334444"]
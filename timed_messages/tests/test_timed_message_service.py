@@ -7,6 +7,7 @@ import pytest
 
 from timed_messages.core.models import MessageStatus
 from timed_messages.core.service import TimedMessageService
+from timed_messages.worker.scheduler import TimedMessageWorker
 
 
 def test_schedule_message_validates_future_and_timezone(fake_repo, fixed_now, monkeypatch):
@@ -128,3 +129,114 @@ def test_validate_assistant_schedule_window(monkeypatch, fake_repo, fixed_now):
     service.validate_assistant_schedule_window(send_at=fixed_now + timedelta(hours=1))
     with pytest.raises(ValueError, match="Free version limit"):
         service.validate_assistant_schedule_window(send_at=fixed_now + timedelta(hours=3))
+
+
+def test_claim_due_messages_locks_each_message_once(fake_repo, fake_transport, fixed_now):
+    service = TimedMessageService(fake_repo, clock=lambda: fixed_now)
+    due = service.schedule_message(
+        chat_id="123",
+        text="due",
+        send_at=fixed_now + timedelta(minutes=1),
+        idempotency_key="claim-1",
+        source="test",
+    )
+    service.schedule_message(
+        chat_id="123",
+        text="later",
+        send_at=fixed_now + timedelta(hours=1),
+        idempotency_key="claim-2",
+        source="test",
+    )
+    service.clock = lambda: fixed_now + timedelta(minutes=2)
+
+    claimed = service.claim_due_messages(limit=10)
+    assert [msg.id for msg in claimed] == [due.id]
+    assert claimed[0].status == MessageStatus.LOCKED
+    assert service.claim_due_messages(limit=10) == []
+
+    service.send_locked_message(claimed[0], fake_transport, quoted_message_id=None)
+    assert fake_transport.sent[0]["text"] == "due"
+    assert fake_repo.get_by_id(due.id).status == MessageStatus.SENT
+
+
+def test_worker_stamps_each_message_when_it_is_sent(fake_repo, fake_transport, fixed_now):
+    service = TimedMessageService(fake_repo, clock=lambda: fixed_now)
+    for n in range(2):
+        service.schedule_message(
+            chat_id="123",
+            text=f"due {n}",
+            send_at=fixed_now + timedelta(minutes=1),
+            idempotency_key=f"tick-{n}",
+            source="test",
+        )
+    ticks = iter(range(1, 100))
+    service.clock = lambda: fixed_now + timedelta(minutes=2, seconds=next(ticks))
+
+    TimedMessageWorker(service, fake_transport)._run_once()
+
+    sent = sorted(fake_repo.messages.values(), key=lambda msg: msg.sent_at)
+    assert [msg.status for msg in sent] == [MessageStatus.SENT, MessageStatus.SENT]
+    assert sent[0].locked_at < sent[0].sent_at < sent[1].sent_at
+
+
+def test_schedule_messages_dedupes_keys_and_keeps_order(fake_repo, fixed_now):
+    service = TimedMessageService(fake_repo, clock=lambda: fixed_now)
+    existing = service.schedule_message(
+        chat_id="123",
+        text="first",
+        send_at=fixed_now + timedelta(minutes=5),
+        idempotency_key="bulk-0",
+        source="test",
+    )
+
+    def spec(key: str, text: str) -> dict:
+        return {
+            "chat_id": "123",
+            "text": text,
+            "send_at": fixed_now + timedelta(minutes=10),
+            "idempotency_key": key,
+            "source": "test",
+        }
+
+    scheduled = service.schedule_messages([
+        spec("bulk-1", "a"),
+        spec("bulk-0", "again"),
+        spec("bulk-1", "a twice"),
+        spec("bulk-2", "b"),
+    ])
+
+    assert [msg.text for msg in scheduled] == ["a", "first", "a", "b"]
+    assert scheduled[1].id == existing.id
+    assert scheduled[0].id == scheduled[2].id
+    assert len(fake_repo.messages) == 3
+
+
+def test_send_message_if_due_skips_unsendable_without_reading_row(
+    fake_repo, fake_transport, fixed_now, monkeypatch
+):
+    service = TimedMessageService(fake_repo, clock=lambda: fixed_now)
+    pending = service.schedule_message(
+        chat_id="123",
+        text="later",
+        send_at=fixed_now + timedelta(minutes=5),
+        idempotency_key="skip-1",
+        source="test",
+    )
+    cancelled = service.schedule_message(
+        chat_id="123",
+        text="cancelled",
+        send_at=fixed_now + timedelta(minutes=1),
+        idempotency_key="skip-2",
+        source="test",
+    )
+    service.cancel_message(cancelled.id)
+
+    def fail_get_by_id(msg_id):
+        raise AssertionError("send_message_if_due should only lock")
+
+    monkeypatch.setattr(fake_repo, "get_by_id", fail_get_by_id)
+    service.clock = lambda: fixed_now + timedelta(minutes=2)
+    service.send_message_if_due(pending.id, fake_transport, quoted_message_id=None)
+    service.send_message_if_due(cancelled.id, fake_transport, quoted_message_id=None)
+
+    assert not fake_transport.sent
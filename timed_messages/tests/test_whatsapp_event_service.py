@@ -42,7 +42,7 @@ def _service_pair(fake_repo, fake_transport, fixed_now):
     return service, event_service
 
 
-def _handle(event_service, fixed_now, **overrides):
+def _handle(event_service, **overrides):
     payload = {
         "message_id": "m1",
         "chat_id": "group-1",
@@ -52,7 +52,6 @@ def _handle(event_service, fixed_now, **overrides):
         "quoted_message_id": None,
         "contact_name": None,
         "contact_phone": None,
-        "timestamp": fixed_now,
         "is_group": True,
         "raw": None,
     }
@@ -64,7 +63,7 @@ def test_assistant_mode_blocks_unauthorized_sender(fake_repo, fake_transport, fi
     monkeypatch.setenv("WHATSAPP_ASSISTANT_MODE", "true")
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, chat_id="dm-1", is_group=False, text="add")
+    handled, reason = _handle(event_service, chat_id="dm-1", is_group=False, text="add")
 
     assert handled is False
     assert reason == "unauthorized_sender"
@@ -76,7 +75,7 @@ def test_non_assistant_rejects_wrong_group(fake_repo, fake_transport, fixed_now,
     runtime_state["group_id"] = "allowed-group"
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, chat_id="group-1", text="add")
+    handled, reason = _handle(event_service, chat_id="group-1", text="add")
 
     assert handled is False
     assert reason == "unauthorized_group"
@@ -88,7 +87,7 @@ def test_auth_command_not_handled_by_timed_messages(fake_repo, fake_transport, f
     runtime_state["group_id"] = "group-1"
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, text="!auth")
+    handled, reason = _handle(event_service, text="!auth")
 
     assert handled is False
     assert reason == "not_actionable"
@@ -99,7 +98,7 @@ def test_whoami_command_not_handled_by_timed_messages(fake_repo, fake_transport,
     runtime_state["group_id"] = "group-1"
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, text="!whoami 123456")
+    handled, reason = _handle(event_service, text="!whoami 123456")
 
     assert handled is False
     assert reason == "not_actionable"
@@ -109,18 +108,17 @@ def test_setup_commands_require_admin_when_not_assistant(fake_repo, fake_transpo
     runtime_state["group_id"] = "group-1"
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, text="!setup timed messages")
+    handled, reason = _handle(event_service, text="!setup timed messages")
     assert handled is False
     assert reason == "admin_not_configured"
 
     runtime_state["admin_sender_id"] = "15559990000"
-    handled, reason = _handle(event_service, fixed_now, text="!setup timed messages")
+    handled, reason = _handle(event_service, text="!setup timed messages")
     assert handled is False
     assert reason == "unauthorized_admin"
 
     handled, reason = _handle(
         event_service,
-        fixed_now,
         text="!setup timed messages",
         sender_id="15559990000",
     )
@@ -129,7 +127,6 @@ def test_setup_commands_require_admin_when_not_assistant(fake_repo, fake_transpo
 
     handled, reason = _handle(
         event_service,
-        fixed_now,
         text="!stop timed messages",
         sender_id="15559990000",
     )
@@ -142,7 +139,7 @@ def test_setup_commands_in_assistant_mode(fake_repo, fake_transport, fixed_now,
     runtime_state["approved_numbers"].add("15551234567")
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, chat_id="dm-1", is_group=False, text="!setup timed messages")
+    handled, reason = _handle(event_service, chat_id="dm-1", is_group=False, text="!setup timed messages")
 
     assert handled is True
     assert reason is None
@@ -154,15 +151,15 @@ def test_help_instructions_and_not_actionable(fake_repo, fake_transport, fixed_n
     runtime_state["group_id"] = "group-1"
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, text="instructions")
+    handled, reason = _handle(event_service, text="instructions")
     assert handled is True and reason is None
     assert "Here are the commands you can run:" in fake_transport.sent[-1]["text"]
 
-    handled, reason = _handle(event_service, fixed_now, text="help")
+    handled, reason = _handle(event_service, text="help")
     assert handled is True and reason is None
     assert "Here are the commands you can run:" in fake_transport.sent[-1]["text"]
 
-    handled, reason = _handle(event_service, fixed_now, text="just chatting")
+    handled, reason = _handle(event_service, text="just chatting")
     assert handled is False and reason == "not_actionable"
 
 
@@ -173,7 +170,7 @@ def test_list_and_cancel_paths(fake_repo, fake_transport, fixed_now, runtime_sta
     service, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
 
     # list empty
-    handled, reason = _handle(event_service, fixed_now, text="list")
+    handled, reason = _handle(event_service, text="list")
     assert handled is True and reason is None
     assert "No scheduled messages" in fake_transport.sent[-1]["text"]
 
@@ -186,17 +183,17 @@ def test_list_and_cancel_paths(fake_repo, fake_transport, fixed_now, runtime_sta
         idempotency_key="key-list",
         source="test",
     )
-    handled, reason = _handle(event_service, fixed_now, text="list")
+    handled, reason = _handle(event_service, text="list")
     assert handled is True and reason is None
     assert msg.id.hex[:12] in fake_transport.sent[-1]["text"]
 
     # invalid cancel
-    handled, reason = _handle(event_service, fixed_now, text="cancel")
+    handled, reason = _handle(event_service, text="cancel")
     assert handled is False
     assert reason == "Invalid_cancel_id. Reply to an approval message with the word cancel."
 
     # valid cancel by prefix
-    handled, reason = _handle(event_service, fixed_now, text=f"cancel {msg.id.hex[:12]}")
+    handled, reason = _handle(event_service, text=f"cancel {msg.id.hex[:12]}")
     assert handled is True and reason is None
     assert fake_repo.get_by_id(msg.id).status == MessageStatus.CANCELLED
 
@@ -219,7 +216,6 @@ def test_cancel_by_quoted_confirmation_message(fake_repo, fake_transport, fixed_
 
     handled, reason = _handle(
         event_service,
-        fixed_now,
         text="cancel",
         quoted_message_id="confirm-1",
     )
@@ -254,7 +250,7 @@ def test_cancel_ambiguous_prefix(fake_repo, fake_transport, fixed_now, runtime_s
     # force an ambiguous prefix in the fake repo
     fake_repo.find_by_id_prefix_for_sender = lambda prefix, normalized_sender_id, limit=2: [a, b]
 
-    handled, reason = _handle(event_service, fixed_now, text="cancel abcdef123456")
+    handled, reason = _handle(event_service, text="cancel abcdef123456")
 
     assert handled is False
     assert reason == "cancel id is ambiguous; please paste the full ID"
@@ -267,18 +263,17 @@ def test_add_flow_valid_and_bad_replies(fake_repo, fake_transport, fixed_now, ru
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
 
-    handled, reason = _handle(event_service, fixed_now, text="add")
+    handled, reason = _handle(event_service, text="add")
     assert handled is True and reason is None
 
     # bad 'to' reply
-    handled, reason = _handle(event_service, fixed_now, text="invalid recipient")
+    handled, reason = _handle(event_service, text="invalid recipient")
     assert handled is True and reason is None
     assert "Please reply with a phone number" in fake_transport.sent[-1]["text"]
 
     # multiple numbers in contact should be rejected
     handled, reason = _handle(
         event_service,
-        fixed_now,
         text="",
         contact_phone=["+1 555 111 2222", "+1 555 333 4444"],
     )
@@ -286,25 +281,25 @@ def test_add_flow_valid_and_bad_replies(fake_repo, fake_transport, fixed_now, ru
     assert reason == "multiple_recipient_numbers"
 
     # set valid recipient and continue
-    handled, reason = _handle(event_service, fixed_now, text="15550001111")
+    handled, reason = _handle(event_service, text="15550001111")
     assert handled is True and reason is None
 
     # invalid when reply
-    handled, reason = _handle(event_service, fixed_now, text="tomorrow")
+    handled, reason = _handle(event_service, text="tomorrow")
     assert handled is True and reason is None
     assert "Invalid time" in fake_transport.sent[-1]["text"]
 
     # valid when reply
-    handled, reason = _handle(event_service, fixed_now, text="today 13:00")
+    handled, reason = _handle(event_service, text="today 13:00")
     assert handled is True and reason is None
 
     # empty text rejected
-    handled, reason = _handle(event_service, fixed_now, text="   ")
+    handled, reason = _handle(event_service, text="   ")
     assert handled is True and reason is None
     assert "can't be empty" in fake_transport.sent[-1]["text"]
 
     # user can cancel during flow
-    handled, reason = _handle(event_service, fixed_now, text="cancel")
+    handled, reason = _handle(event_service, text="cancel")
     assert handled is True and reason is None
     assert "Canceled scheduling" in fake_transport.sent[-1]["text"]
 
@@ -314,7 +309,7 @@ def test_no_text_is_not_actionable_when_idle(fake_repo, fake_transport, fixed_no
     runtime_state["group_id"] = "group-1"
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
-    handled, reason = _handle(event_service, fixed_now, text="")
+    handled, reason = _handle(event_service, text="")
 
     assert handled is False
     assert reason == "no_text"
@@ -325,17 +320,17 @@ def test_auth_commands_are_ignored_in_assistant_mode(fake_repo, fake_transport,
 
     _, event_service = _service_pair(fake_repo, fake_transport, fixed_now)
 
-    handled, reason = _handle(event_service, fixed_now, chat_id="dm-1", is_group=False, text="!auth")
+    handled, reason = _handle(event_service, chat_id="dm-1", is_group=False, text="!auth")
     assert handled is False
     assert reason == "not_actionable"
     assert fake_transport.sent == []
 
-    handled, reason = _handle(event_service, fixed_now, chat_id="dm-1", is_group=False, text="!auth 654321")
+    handled, reason = _handle(event_service, chat_id="dm-1", is_group=False, text="!auth 654321")
     assert handled is False
     assert reason == "not_actionable"
     assert fake_transport.sent == []
 
-    handled, reason = _handle(event_service, fixed_now, chat_id="dm-1", is_group=False, text="!whoami 123456")
+    handled, reason = _handle(event_service, chat_id="dm-1", is_group=False, text="!whoami 123456")
     assert handled is False
     assert reason == "not_actionable"
     assert fake_transport.sent == []
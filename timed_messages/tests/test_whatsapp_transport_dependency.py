@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 
 from timed_messages.core.flow_store import InMemoryFlowStore
 from timed_messages.core.whatsapp_event_service import WhatsAppEventService
@@ -37,15 +37,13 @@ def test_event_service_dependency_reuses_injected_stores(monkeypatch):
 
     assert service_a.flow_store is flow_store
     assert service_b.flow_store is flow_store
-    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
     service_a._start_flow(
         chat_id="chat-1",
         sender_id="sender-1",
         message_id="msg-1",
-        timestamp=timestamp,
     )
 
-    flow = service_b._get_active_flow("chat-1", "sender-1", timestamp)
+    flow = service_b._get_active_flow("chat-1", "sender-1")
     assert flow is not None
     assert flow["step"] == "to"
 
@@ -1,5 +1,4 @@
 import logging
-from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Generator
 
 import requests
@@ -8,6 +7,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 
+from shared.gateway_http import gateway_session
 from shared.runtime_config import whatsapp_gateway_url
 
 from ..core.flow_store import FlowStore
@@ -28,6 +28,7 @@ class WhatsAppTransport:
     def __init__(self, base_url: str | None = None, timeout_seconds: int = 5):
         self.base_url = base_url or whatsapp_gateway_url()
         self.timeout = timeout_seconds
+        self.session = gateway_session()
 
     def send_message(
         self,
@@ -49,7 +50,7 @@ class WhatsAppTransport:
             payload["message_id"] = str(message_id)
 
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 f"{self.base_url}/send",
                 json=payload,
                 timeout=self.timeout,
@@ -129,7 +130,6 @@ def create_router(
                 quoted_message_id=event.quoted_message_id,
                 contact_name=event.contact_name,
                 contact_phone=event.contact_phone,
-                timestamp=datetime.fromtimestamp(event.timestamp, tz=timezone.utc),
                 is_group=event.is_group,
                 raw=event.raw,
             )
@@ -40,9 +40,11 @@ class TimedMessageWorker:
         self._running = False
 
     def _run_once(self):
-        due_messages = self.service.list_due_messages(
-            limit=self.batch_size
-        )
+        # Claimed messages come back already locked for this worker. The locks
+        # are not renewed, so the whole batch must be sent before the repository
+        # treats them as stale (LOCK_TIMEOUT_SECONDS, 300s): with the defaults,
+        # 10 sends of at most ~20s each (5s timeouts, two connect retries).
+        due_messages = self.service.claim_due_messages(limit=self.batch_size)
 
         if not due_messages:
             logger.debug("No due messages")
@@ -54,10 +56,10 @@ class TimedMessageWorker:
         for msg in due_messages:
             try:
                 logger.info("Sending message %s to %s", msg.id, msg.chat_id)
-                self.service.send_message_if_due(
-                    msg_id=msg.id,
-                    transport=self.transport,
-                    quoted_message_id=None
+                self.service.send_locked_message(
+                    msg,
+                    self.transport,
+                    quoted_message_id=None,
                 )
                 logger.info("Sent message %s", msg.id)
             except Exception: